@@ -5,26 +5,75 @@ Audio capture service that runs in a background thread and writes audio data
 to SharedState for visualization by the renderer.
 """
 
+import math
 import numpy as np
-import sounddevice as sd
 import threading
 import logging
+from cpu_affinity import pin_current_thread, AUDIO_CORE
+from config import MAX_AUDIO_PASSTHROUGH_GAIN
 
 # Constants for audio processing
 SAMPLERATE = 48000
-FRAMES_PER_BUFFER = 1024
+FRAMES_PER_BUFFER = 2048  # Input-only capture: ~23 callbacks/s at 48 kHz; the visualizer FFTs the newest 1024
+PASSTHROUGH_FRAMES_PER_BUFFER = 1024  # Duplex passthrough: the block size is output latency (~21 ms)
+GAIN_SHIFT = 12  # Passthrough gain is applied in Q12 fixed point (4096 = unity)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
 
-def start_audio_service(shared_state, stop_event, enable_passthrough=True, output_device=None):
+def passthrough_gain_fixed_point(passthrough_gain):
+    """
+    Convert a linear passthrough gain to its Q12 fixed-point multiplier.
+    
+    Gains outside 0.0 - MAX_AUDIO_PASSTHROUGH_GAIN are clamped so the int32
+    multiply cannot overflow (8 * 4096 * 32768 = 2**30); NaN and infinite gains
+    fall back to unity.
+    
+    Args:
+        passthrough_gain: Linear gain (1.0 = unchanged)
+    
+    Returns:
+        int: Gain multiplier, where 1 << GAIN_SHIFT is unity
+    """
+    if not math.isfinite(passthrough_gain):
+        logger.warning("[Audio] Passthrough gain %s is not a finite number, using 1.0", passthrough_gain)
+        passthrough_gain = 1.0
+    elif not 0.0 <= passthrough_gain <= MAX_AUDIO_PASSTHROUGH_GAIN:
+        clamped = min(max(passthrough_gain, 0.0), MAX_AUDIO_PASSTHROUGH_GAIN)
+        logger.warning("[Audio] Passthrough gain %s out of range, using %s", passthrough_gain, clamped)
+        passthrough_gain = clamped
+    return int(round(passthrough_gain * (1 << GAIN_SHIFT)))
+
+
+def apply_passthrough_gain(indata, outdata, gain_num, scratch):
+    """
+    Scale int16 samples by a Q12 gain, hard-clipping to the int16 range.
+    
+    Args:
+        indata: int16 input samples
+        outdata: int16 array of the same shape to write the result to
+        gain_num: Multiplier from passthrough_gain_fixed_point
+        scratch: int32 array of the same shape used for the intermediate result
+    """
+    if gain_num == 1 << GAIN_SHIFT:
+        outdata[:] = indata
+        return
+    # Widen, scale, shift back and saturate to int16
+    np.copyto(scratch, indata)
+    scratch *= gain_num
+    scratch >>= GAIN_SHIFT
+    np.clip(scratch, -32768, 32767, out=scratch)
+    np.copyto(outdata, scratch, casting='unsafe')
+
+
+def start_audio_service(shared_state, stop_event, enable_passthrough=True, output_device=None,
+                        passthrough_gain=1.0):
     """
     Starts the audio capture service in a background daemon thread.
     
     This service captures audio from the default microphone and writes the
-    audio buffer to SharedState for visualization. Optionally supports
+    int16 PCM audio buffer to SharedState for visualization. Optionally supports
     audio passthrough to an output device.
     
     Args:
@@ -32,71 +81,101 @@ def start_audio_service(shared_state, stop_event, enable_passthrough=True, outpu
         stop_event: threading.Event to signal service shutdown
         enable_passthrough: If True, pass audio through to output device
         output_device: Device index or name for audio output (None = default)
+        passthrough_gain: Linear gain applied to passthrough audio (1.0 = unchanged);
+                          amplified samples are hard-clipped to the int16 range.
+                          Clamped to 0.0 - MAX_AUDIO_PASSTHROUGH_GAIN so the
+                          fixed-point multiply cannot overflow int32 (NaN = 1.0)
     
     Returns:
         threading.Thread: The started daemon thread
     """
+    # Fixed-point passthrough gain, applied in an int32 scratch buffer
+    gain_num = passthrough_gain_fixed_point(passthrough_gain)
+    
     def audio_service_thread():
         """Main audio service thread function."""
-        input_stream = None
-        output_stream = None
-        audio_buffer = np.zeros(FRAMES_PER_BUFFER, dtype=np.float32)
-        buffer_lock = threading.Lock()
+        try:
+            # Imported here so the module (and its gain helpers) load without
+            # PortAudio, which sounddevice needs at import time
+            import sounddevice as sd
+        except (ImportError, OSError) as e:
+            logger.error("[Audio] Failed to import sounddevice: %s", e)
+            logger.error("[Audio] Install with: pip install sounddevice (requires PortAudio)")
+            return
+        
+        stream = None
+        # Only touched from the PortAudio callback thread, so no lock is needed;
+        # SharedState copies each block into its lock-free audio ring. Sized for
+        # the larger (input-only) block size
+        audio_buffer = np.zeros(FRAMES_PER_BUFFER, dtype=np.int16)
+        callback_pinned = False  # PortAudio owns the callback thread, so pin it on first use
+        
+        gain_scratch = np.empty((FRAMES_PER_BUFFER, 1), dtype=np.int32)
         
-        def audio_callback(indata, frames, time_info, status):
+        def input_callback(indata, frames, time_info, status):
             """
             Callback function for sounddevice.InputStream.
             Copies audio data into buffer and writes to SharedState.
             """
-            nonlocal audio_buffer, output_stream
+            nonlocal callback_pinned
+            if not callback_pinned:
+                pin_current_thread(AUDIO_CORE, "audio callback")
+                callback_pinned = True
             
             # Log any status issues
             if status:
-                logger.warning(f"[Audio] Stream status: {status}")
+                logger.warning("[Audio] Stream status: %s", status)
             
-            # Copy audio data to local buffer
-            with buffer_lock:
-                audio_buffer[:] = np.copy(indata[:, 0])
+            # Copy audio data to local buffer in place
+            block = audio_buffer[:frames]
+            np.copyto(block, indata[:, 0])
             
-            # Write to SharedState
-            shared_state.set_audio_buffer(audio_buffer)
-            
-            # Pass through to output if enabled
-            if output_stream and enable_passthrough:
-                try:
-                    output_stream.write(indata)
-                except sd.PortAudioError as e:
-                    logger.error(f"[Audio] Output stream error: {e}")
+            # Write to SharedState (only this callback's samples)
+            shared_state.set_audio_buffer(block)
+        
+        def duplex_callback(indata, outdata, frames, time_info, status):
+            """
+            Callback function for the duplex sounddevice.Stream.
+            Passes input through to the output (with gain) and publishes it.
+            """
+            apply_passthrough_gain(indata, outdata, gain_num, gain_scratch[:frames])
+            input_callback(indata, frames, time_info, status)
         
         try:
-            # Initialize input stream
-            logger.info("[Audio] Initializing audio input stream...")
-            input_stream = sd.InputStream(
-                callback=audio_callback,
-                channels=1,
-                samplerate=SAMPLERATE,
-                blocksize=FRAMES_PER_BUFFER,
-                dtype='int16'
-            )
-            input_stream.start()
-            logger.info("[Audio] Audio input stream started successfully")
-            
-            # Initialize output stream for passthrough if enabled
+            # Use a single duplex stream for passthrough so PortAudio hands us
+            # input and output buffers in the same callback
             if enable_passthrough:
                 try:
-                    logger.info(f"[Audio] Initializing audio passthrough to device: {output_device or 'default'}")
-                    output_stream = sd.OutputStream(
+                    logger.info("[Audio] Initializing audio passthrough to device: %s", output_device or 'default')
+                    stream = sd.Stream(
+                        callback=duplex_callback,
+                        channels=(1, 1),
                         samplerate=SAMPLERATE,
-                        channels=1,
-                        device=output_device,
+                        blocksize=PASSTHROUGH_FRAMES_PER_BUFFER,
+                        device=(None, output_device),
                         dtype='int16'
                     )
-                    output_stream.start()
+                    stream.start()
                     logger.info("[Audio] Audio passthrough started successfully")
                 except Exception as e:
-                    logger.warning(f"[Audio] Failed to initialize passthrough: {e}")
+                    logger.warning("[Audio] Failed to initialize passthrough: %s", e)
                     logger.info("[Audio] Continuing without passthrough")
-                    output_stream = None
+                    if stream:
+                        stream.close()
+                    stream = None
+            
+            # Fall back to (or use only) an input stream
+            if stream is None:
+                logger.info("[Audio] Initializing audio input stream...")
+                stream = sd.InputStream(
+                    callback=input_callback,
+                    channels=1,
+                    samplerate=SAMPLERATE,
+                    blocksize=FRAMES_PER_BUFFER,
+                    dtype='int16'
+                )
+                stream.start()
+                logger.info("[Audio] Audio input stream started successfully")
             
             # Keep thread alive until stop_event is set
             while not stop_event.is_set():
@@ -105,25 +184,17 @@ def start_audio_service(shared_state, stop_event, enable_passthrough=True, outpu
             logger.info("[Audio] Stop signal received, shutting down...")
             
         except Exception as e:
-            logger.error(f"[Audio] Audio service error: {e}", exc_info=True)
+            logger.error("[Audio] Audio service error: %s", e, exc_info=True)
         
         finally:
-            # Clean up streams
-            if input_stream:
-                try:
-                    input_stream.stop()
-                    input_stream.close()
-                    logger.info("[Audio] Input stream closed")
-                except Exception as e:
-                    logger.error(f"[Audio] Error closing input stream: {e}")
-            
-            if output_stream:
+            # Clean up stream
+            if stream:
                 try:
-                    output_stream.stop()
-                    output_stream.close()
-                    logger.info("[Audio] Output stream closed")
+                    stream.stop()
+                    stream.close()
+                    logger.info("[Audio] Audio stream closed")
                 except Exception as e:
-                    logger.error(f"[Audio] Error closing output stream: {e}")
+                    logger.error("[Audio] Error closing audio stream: %s", e)
     
     # Create and start daemon thread
     thread = threading.Thread(target=audio_service_thread, daemon=True, name="AudioService")
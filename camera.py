@@ -1,11 +1,14 @@
+import sys
 import cv2
-from threading import Thread
+import numpy as np
+from threading import Thread, Event, Lock
+from cpu_affinity import pin_current_thread, CAMERA_CORE
 
 class CameraStream:
     """
     CameraStream class handles video capture from a camera source in a separate thread to improve performance.
     """
-    def __init__(self, src=0, width=1280, height=720):
+    def __init__(self, src=0, width=1280, height=720, rotation=None):
         """
         Initialize the camera stream with the given source and resolution.
         
@@ -13,9 +16,21 @@ class CameraStream:
             src (int or str): Camera source index or video file path.
             width (int): Desired width of the video frames.
             height (int): Desired height of the video frames.
+            rotation (int, optional): cv2.ROTATE_* code applied to every frame
+                on the capture thread, or None to publish frames as decoded.
         """
-        # Open the video capture stream
-        self.stream = cv2.VideoCapture(src)
+        self.rotation = rotation
+
+        # Open the video capture stream, preferring the V4L2 backend on Linux so
+        # the MJPG/buffer-size settings below go straight to the driver
+        self.stream = None
+        if sys.platform.startswith("linux"):
+            self.stream = cv2.VideoCapture(src, cv2.CAP_V4L2)
+            if not self.stream.isOpened():
+                self.stream.release()
+                self.stream = None
+        if self.stream is None:
+            self.stream = cv2.VideoCapture(src)
         if not self.stream.isOpened():
             # Raise an error if the camera stream cannot be opened
             raise RuntimeError("Failed to open camera stream.")
@@ -30,8 +45,37 @@ class CameraStream:
         self.stream.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         self.stream.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
-        # Read the first frame from the stream to initialize
-        self.grabbed, self.frame = self.stream.read()
+        # Read the first frame from the stream to initialize; requiring it here
+        # means read() always has a valid frame to return
+        self.grabbed, frame = self.stream.read()
+        if not self.grabbed:
+            self.stream.release()
+            raise RuntimeError("Failed to read a frame from the camera stream.")
+
+        # Frames are handed off: once read() returns a frame the caller owns it
+        # and the capture thread never writes to it again. A published frame
+        # that was never read is recycled as the next capture's buffer, so
+        # arrays are only allocated for frames the consumer actually takes
+        if rotation is None:
+            self._frame = frame
+        else:
+            # Decode into one reused scratch buffer, rotate into the frame
+            self._decode = frame
+            self._frame = cv2.rotate(frame, rotation)
+        self._spare = np.empty_like(self._frame)
+        self._seq = 1  # Frames published so far
+        self._read_seq = 0  # Value of _seq when read() last took a frame
+        # Publishing a frame and read() taking it (with the new_frame Event
+        # updates) happen under this lock, so a frame, its sequence number and
+        # the Event state are always seen together
+        self._lock = Lock()
+
+        # Set whenever a new frame is published, cleared by read(); both happen
+        # under _lock, so it is set exactly when there is a frame read() has not
+        # returned yet and consumers never re-process the same one
+        self.new_frame = Event()
+        self.new_frame.set()
+
         # Flag to indicate if the thread should stop running
         self.stopped = False
 
@@ -44,22 +88,47 @@ class CameraStream:
         Continuously capture frames from the camera stream in a separate thread.
         This method runs in the background and updates the current frame.
         """
+        pin_current_thread(CAMERA_CORE, "camera")
         while not self.stopped:
             # If frame capture failed, stop the stream
             if not self.grabbed:
                 self.stop()
             else:
-                # Read the next frame from the stream
-                self.grabbed, self.frame = self.stream.read()
+                # Grab the next frame, then decode it into the spare buffer
+                # (a None spare makes OpenCV allocate a new one)
+                self.grabbed = self.stream.grab()
+                if self.grabbed:
+                    if self.rotation is None:
+                        self.grabbed, frame = self.stream.retrieve(self._spare)
+                    else:
+                        self.grabbed, self._decode = self.stream.retrieve(self._decode)
+                        frame = cv2.rotate(self._decode, self.rotation, self._spare) if self.grabbed else None
+                    if self.grabbed:
+                        with self._lock:
+                            # Recycle the previous frame unless read() handed it out
+                            previous = self._frame if self._read_seq != self._seq else None
+                            self._frame = frame
+                            self._seq += 1
+                            self.new_frame.set()
+                        self._spare = previous
 
     def read(self):
         """
         Return the most recent frame captured from the camera stream.
         
+        Never returns None: the constructor fails if no first frame can be read,
+        and if capture later stops the last good frame is returned.
+        
+        The caller owns the returned frame (it may draw on it or hand it to
+        another thread); the capture thread writes later frames elsewhere.
+        
         Returns:
             frame (ndarray): The latest video frame.
         """
-        return self.frame
+        with self._lock:
+            self.new_frame.clear()
+            self._read_seq = self._seq
+            return self._frame
 
     def stop(self):
         """
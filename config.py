@@ -36,6 +36,10 @@ Service Enable Flags:
   Default: True (requires audio input device)
   Hardware: Any microphone or audio input device
 
+- audio_passthrough_gain: Linear gain applied to audio passed through to the output
+  Default: 1.0 (unchanged); louder samples are hard-clipped
+  Range: 0.0 - 8.0 (values outside are clamped)
+
 Interface Configuration:
 - wifi_interface: Primary Wi-Fi interface name for scanning
   Default: "wlan0"
@@ -65,6 +69,9 @@ When a service is disabled or hardware is unavailable:
 - Service threads exit gracefully without crashing the system
 """
 
+import math
+from types import MappingProxyType
+
 # Default configuration for the HUD system
 # Modify these values based on your hardware setup
 HUD_CONFIG = {
@@ -104,6 +111,11 @@ HUD_CONFIG = {
     # Set to True to enable audio visualization
     "enable_audio": True,
     
+    # Linear volume gain for audio passed through to the output device
+    # 1.0 = unchanged, 0.5 = half volume, 2.0 = double (clipped at full scale)
+    # Must be between 0.0 and MAX_AUDIO_PASSTHROUGH_GAIN; other values are clamped
+    "audio_passthrough_gain": 1.0,
+    
     # ===== Wi-Fi Interface Configuration =====
     # IMPORTANT: For Wi-Fi scanning and direction finding, use USB Wi-Fi adapters
     # DO NOT use the onboard wireless interface (typically wlan0 or wlp1s0)
@@ -153,13 +165,36 @@ HUD_CONFIG = {
 }
 
 
+# Largest supported audio_passthrough_gain: the Q12 fixed-point gain times a
+# full-scale int16 sample must stay within int32
+MAX_AUDIO_PASSTHROUGH_GAIN = 8.0
+
+
+# Read-only view of HUD_CONFIG, built once so get_config() doesn't copy per call
+_CONFIG_VIEW = MappingProxyType(HUD_CONFIG)
+
+
 def get_config():
     """
-    Returns the HUD configuration dictionary.
+    Returns a read-only view of the HUD configuration.
     
     This function can be extended to load configuration from a file
     (e.g., JSON, YAML, INI) in future versions.
     
+    Returns:
+        MappingProxyType: Read-only configuration mapping with service enable
+                          flags and parameters
+    """
+    return _CONFIG_VIEW
+
+
+def get_config_mutable():
+    """
+    Returns a mutable copy of the HUD configuration.
+    
+    Use this when the caller needs to adjust settings at runtime (e.g.,
+    disabling a service after a failed calibration).
+    
     Returns:
         dict: Configuration dictionary with service enable flags and parameters
     """
@@ -174,6 +209,7 @@ def validate_config(config):
     - Wi-Fi locator enabled without dual adapters configured
     - Wi-Fi locator enabled without heading source (GPS or IMU)
     - Invalid interface names (basic validation)
+    - Audio passthrough gain outside the supported range
     
     Args:
         config: Configuration dictionary to validate
@@ -242,5 +278,18 @@ def validate_config(config):
                 "This is NOT recommended. Use a USB Wi-Fi adapter (wlan1, wlan2, or wlx*) instead."
             )
     
+    # Check audio passthrough gain range
+    if config.get("enable_audio", False):
+        gain = config.get("audio_passthrough_gain", 1.0)
+        if not math.isfinite(gain):
+            warnings.append(
+                f"Audio passthrough gain {gain} is not a finite number; 1.0 will be used instead."
+            )
+        elif not 0.0 <= gain <= MAX_AUDIO_PASSTHROUGH_GAIN:
+            warnings.append(
+                f"Audio passthrough gain {gain} is outside 0.0 - {MAX_AUDIO_PASSTHROUGH_GAIN}; "
+                "it will be clamped to that range."
+            )
+    
     is_valid = len(warnings) == 0
     return is_valid, warnings
@@ -0,0 +1,48 @@
+"""
+cpu_affinity.py
+---------------
+Best-effort CPU pinning for the HUD's long-lived threads.
+
+Keeping each workload on its own core stops the scheduler from migrating it
+between cores and keeps that core's caches warm. Pinning is skipped silently on
+platforms without os.sched_setaffinity (e.g., macOS, Windows) or when the
+system has fewer cores than the requested one.
+"""
+
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Core assignments for a 4-core board (Raspberry Pi 5, LattePanda Alpha);
+# core 0 is left to the main render loop and the rest of the system
+CAMERA_CORE = 3   # Camera capture thread
+AUDIO_CORE = 2    # PortAudio callback thread
+SERVICE_CORE = 1  # Low-rate services (system metrics, GPS, IMU)
+
+
+def pin_current_thread(core, label=""):
+    """
+    Pin the calling thread to a single CPU core if the platform supports it.
+
+    Args:
+        core: Index of the core to run on
+        label: Optional name used in the log message
+
+    Returns:
+        bool: True if the thread was pinned, False otherwise
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+
+    try:
+        if core not in os.sched_getaffinity(0):
+            return False
+        # pid 0 applies to the calling thread on Linux
+        os.sched_setaffinity(0, {core})
+    except OSError as e:
+        logger.debug("Could not pin %s thread to core %d: %s", label or "current", core, e)
+        return False
+
+    logger.debug("Pinned %s thread to core %d", label or "current", core)
+    return True
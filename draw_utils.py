@@ -1,24 +1,254 @@
 # draw_utils.py
 # Helper functions for drawing HUD widgets
 
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+from theme import FONT, FONT_SCALE, THICKNESS
+
+# Outlined text is rasterized once per (text, color) into a sprite and then
+# composited, since most HUD strings repeat from frame to frame
+TEXT_SPRITE_CACHE_SIZE = 256
+OUTLINE_THICKNESS = THICKNESS + 2
+_TEXT_PAD = OUTLINE_THICKNESS  # Room around the glyph box for the outline stroke
+_text_sprites = OrderedDict()
+
+# Whole HUD widgets captured as sprites while their inputs stay the same,
+# keyed by layer name: (key, frames seen with that key, sprite entry or None)
+_cached_layers = {}
+
+# A layer is captured only once its key has held for this many frames in a row,
+# so widgets that change every frame or two (slow head turns) never pay for it
+CACHED_LAYER_STABLE_FRAMES = 3
+
+# Black and white capture canvases keyed by frame shape, reused between captures;
+# only the captured bounds are cleared and read
+_capture_canvases = {}
+
+# Groups of text lines composited into one sprite, keyed by panel name, so a
+# panel whose text hasn't changed is a single blit
+_text_panels = {}
+
+
+def _build_text_sprite(text, color):
+    """
+    Rasterize outlined text onto a black canvas.
+
+    Returns:
+        Tuple of (sprite, inv_alpha, x_offset, y_offset): the text premultiplied
+        over black, the surviving background weight out of 255 (3 channels), and the offset of
+        the sprite's top-left corner from the text origin
+    """
+    (w, h), baseline = cv2.getTextSize(text, FONT, FONT_SCALE, OUTLINE_THICKNESS)
+    origin = (_TEXT_PAD, _TEXT_PAD + h)
+    size = (h + baseline + 2 * _TEXT_PAD, w + 2 * _TEXT_PAD)
+
+    # Fraction of the background that survives the outline and then the foreground
+    outline_alpha = np.zeros(size, dtype=np.uint8)
+    cv2.putText(outline_alpha, text, origin, FONT, FONT_SCALE, 255, OUTLINE_THICKNESS, cv2.LINE_AA)
+    fg_alpha = np.zeros(size, dtype=np.uint8)
+    cv2.putText(fg_alpha, text, origin, FONT, FONT_SCALE, 255, THICKNESS, cv2.LINE_AA)
+    inv_alpha = cv2.multiply(255 - outline_alpha, 255 - fg_alpha, scale=1.0 / 255.0)
+    inv_alpha = cv2.cvtColor(inv_alpha, cv2.COLOR_GRAY2BGR)
+
+    # Foreground over black; the black outline contributes nothing here
+    sprite = np.zeros(size + (3,), dtype=np.uint8)
+    cv2.putText(sprite, text, origin, FONT, FONT_SCALE, color, THICKNESS, cv2.LINE_AA)
+
+    return sprite, inv_alpha, -_TEXT_PAD, -(_TEXT_PAD + h)
+
+
+def build_sprite(size, layers):
+    """
+    Rasterize drawing layers into a premultiplied sprite for blit_sprite.
+
+    Args:
+        size: (height, width) of the sprite
+        layers: List of (draw, color) pairs, in drawing order, where
+            draw(canvas, color) issues the OpenCV calls for that layer
+
+    Returns:
+        Tuple of (sprite, inv_alpha): the layers drawn over black, and the
+        background weight out of 255 left after all layers (3 channels)
+    """
+    sprite = np.zeros(tuple(size) + (3,), dtype=np.uint8)
+    inv_alpha = np.full(size, 255, dtype=np.uint8)
+    layer_alpha = np.empty(size, dtype=np.uint8)
+    for draw, color in layers:
+        draw(sprite, color)
+        layer_alpha.fill(0)
+        draw(layer_alpha, 255)
+        inv_alpha = cv2.multiply(inv_alpha, 255 - layer_alpha, scale=1.0 / 255.0)
+    return sprite, cv2.cvtColor(inv_alpha, cv2.COLOR_GRAY2BGR)
+
+
+def blit_sprite(frame, sprite, inv_alpha, x0, y0):
+    """
+    Composite a premultiplied sprite onto the frame, clipped to the frame edges.
+
+    Args:
+        frame: BGR frame to draw on (modified in place)
+        sprite: BGR sprite rendered over black (premultiplied by its coverage)
+        inv_alpha: Per-pixel background weight out of 255, same shape as sprite
+        x0, y0: Frame position of the sprite's top-left corner
+    """
+    sh, sw = sprite.shape[:2]
+    fh, fw = frame.shape[:2]
+    cx0, cy0 = max(x0, 0), max(y0, 0)
+    cx1, cy1 = min(x0 + sw, fw), min(y0 + sh, fh)
+    if cx0 >= cx1 or cy0 >= cy1:
+        return
+    roi = frame[cy0:cy1, cx0:cx1]
+    sx0, sy0 = cx0 - x0, cy0 - y0
+    sx1, sy1 = sx0 + (cx1 - cx0), sy0 + (cy1 - cy0)
+
+    # Darken by the sprite's coverage, then add the premultiplied colors
+    cv2.multiply(roi, inv_alpha[sy0:sy1, sx0:sx1], dst=roi, scale=1.0 / 255.0)
+    cv2.add(roi, sprite[sy0:sy1, sx0:sx1], dst=roi)
+
+
+def _darkened(roi, keep):
+    """Return roi scaled by keep using 8-bit fixed point (keep * 256, then >> 8)."""
+    scaled = np.multiply(roi, int(round(keep * 256)), dtype=np.uint16)
+    scaled >>= 8
+    return scaled.astype(np.uint8)
+
+
+def darken_rect(frame, pt1, pt2, keep=0.3):
+    """
+    Scale a filled rectangle of the frame toward black, in place.
+
+    Same result as drawing a black filled rectangle on a copy of the frame
+    and blending it back with cv2.addWeighted, but only the rectangle's
+    pixels are touched, with integer math (keep=0.3 is applied as 77/256).
+
+    Args:
+        frame: BGR frame to draw on (modified in place)
+        pt1, pt2: Opposite (inclusive) corners of the rectangle, as for cv2.rectangle
+        keep: Fraction of the original brightness left inside the rectangle
+    """
+    fh, fw = frame.shape[:2]
+    x0, x1 = max(min(pt1[0], pt2[0]), 0), min(max(pt1[0], pt2[0]) + 1, fw)
+    y0, y1 = max(min(pt1[1], pt2[1]), 0), min(max(pt1[1], pt2[1]) + 1, fh)
+    if x0 >= x1 or y0 >= y1:
+        return
+    roi = frame[y0:y1, x0:x1]
+    roi[...] = _darkened(roi, keep)
+
+
+def darken_rects(frame, rects, keep=0.3):
+    """
+    Scale the union of several filled rectangles toward black, in place.
+
+    Overlapping rectangles are darkened once, in a single pass over their
+    combined bounding box.
+
+    Args:
+        frame: BGR frame to draw on (modified in place)
+        rects: List of ((x1, y1), (x2, y2)) inclusive corner pairs
+        keep: Fraction of the original brightness left inside the rectangles
+    """
+    if len(rects) == 1:
+        darken_rect(frame, rects[0][0], rects[0][1], keep)
+        return
+    if not rects:
+        return
+
+    fh, fw = frame.shape[:2]
+    x0 = max(min(min(p1[0], p2[0]) for p1, p2 in rects), 0)
+    y0 = max(min(min(p1[1], p2[1]) for p1, p2 in rects), 0)
+    x1 = min(max(max(p1[0], p2[0]) for p1, p2 in rects) + 1, fw)
+    y1 = min(max(max(p1[1], p2[1]) for p1, p2 in rects) + 1, fh)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    roi = frame[y0:y1, x0:x1]
+    mask = np.zeros(roi.shape[:2], dtype=np.uint8)
+    for p1, p2 in rects:
+        cv2.rectangle(mask, (p1[0] - x0, p1[1] - y0), (p2[0] - x0, p2[1] - y0), 255, -1)
+    cv2.copyTo(_darkened(roi, keep), mask, roi)
+
+
+def _get_text_sprite(text, color):
+    """Return the cached sprite entry for (text, color), building it if needed."""
+    key = (text, color)
+    entry = _text_sprites.get(key)
+    if entry is None:
+        entry = _build_text_sprite(text, color)
+        _text_sprites[key] = entry
+        if len(_text_sprites) > TEXT_SPRITE_CACHE_SIZE:
+            _text_sprites.popitem(last=False)
+    else:
+        _text_sprites.move_to_end(key)
+    return entry
+
+
+def _build_text_panel(items):
+    """
+    Composite several outlined text lines into one sprite.
+
+    Returns:
+        Tuple of (sprite, inv_alpha, x0, y0) for blit_sprite
+    """
+    entries = []
+    for text, (x, y), color in items:
+        sprite, inv_alpha, dx, dy = _get_text_sprite(text, color)
+        entries.append((sprite, inv_alpha, x + dx, y + dy))
+
+    x0 = min(e[2] for e in entries)
+    y0 = min(e[3] for e in entries)
+    x1 = max(e[2] + e[0].shape[1] for e in entries)
+    y1 = max(e[3] + e[0].shape[0] for e in entries)
+
+    # Stack the lines in drawing order: colors over black, and the background
+    # weight multiplied down by each line's coverage
+    panel = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+    panel_inv = np.full((y1 - y0, x1 - x0, 3), 255, dtype=np.uint8)
+    for sprite, inv_alpha, sx, sy in entries:
+        blit_sprite(panel, sprite, inv_alpha, sx - x0, sy - y0)
+        h, w = sprite.shape[:2]
+        roi = panel_inv[sy - y0:sy - y0 + h, sx - x0:sx - x0 + w]
+        cv2.multiply(roi, inv_alpha, dst=roi, scale=1.0 / 255.0)
+
+    return panel, panel_inv, x0, y0
+
+
+def draw_text_panel(frame, name, items):
+    """
+    Draw a group of outlined text lines as one cached composite.
+
+    The panel is rebuilt only when its items change, so static or slowly
+    changing text costs one blit per frame.
+
+    Args:
+        frame: BGR frame to draw on
+        name: Key identifying the panel between frames
+        items: Sequence of (text, (x, y), color) tuples, drawn in order
+    """
+    items = tuple(items)
+    cached = _text_panels.get(name)
+    if cached is None or (cached[0] is not items and cached[0] != items):
+        cached = (items, _build_text_panel(items))
+        _text_panels[name] = cached
+    sprite, inv_alpha, x0, y0 = cached[1]
+    blit_sprite(frame, sprite, inv_alpha, x0, y0)
+
+
 def draw_text(frame, text, position, color):
-    import cv2
-    from theme import FONT, FONT_SCALE, THICKNESS
-    x, y = position
-    # Outline
-    cv2.putText(frame, text, (x, y), FONT, FONT_SCALE, (0, 0, 0), THICKNESS + 2, cv2.LINE_AA)
-    # Foreground
-    cv2.putText(frame, text, (x, y), FONT, FONT_SCALE, color, THICKNESS, cv2.LINE_AA)
+    sprite, inv_alpha, dx, dy = _get_text_sprite(text, color)
+    blit_sprite(frame, sprite, inv_alpha, position[0] + dx, position[1] + dy)
     # This function draws text on the given frame at the specified position with a colored foreground and a black outline to enhance visibility.
 
 def draw_bar(frame, value, max_value, position, color):
-    import cv2
     x, y = position
     bar_width = 200
     bar_height = 20
-    # Calculate the fill ratio, clamping between 0 and 1 to avoid overflow or underflow
-    fill_ratio = max(0.0, min(value / max_value, 1.0))
-    fill_width = int(bar_width * fill_ratio)
+    # Calculate the fill width directly in pixels (no intermediate ratio), clamping
+    # between 0 and bar_width to avoid overflow or underflow
+    fill_width = int(value * bar_width // max_value) if value > 0 else 0
+    if fill_width > bar_width:
+        fill_width = bar_width
 
     # Draw the background rectangle of the bar (gray color)
     cv2.rectangle(frame, (x, y), (x + bar_width, y + bar_height), (50, 50, 50), -1)
@@ -27,3 +257,93 @@ def draw_bar(frame, value, max_value, position, color):
     # Draw the outline of the bar in white for clear separation
     cv2.rectangle(frame, (x, y), (x + bar_width, y + bar_height), (255, 255, 255), 1)
     # This function draws a horizontal bar representing a value relative to a maximum value, useful for HUD indicators like health or progress.
+
+
+def _capture_layer(shape, draw, bounds=None):
+    """
+    Capture a widget's drawing as a premultiplied sprite, cropped to what it touches.
+
+    The widget is drawn once over black and once over white. Everything it does
+    (opaque lines, anti-aliased edges, darkened backgrounds) scales the
+    background and adds a color, so the black pass gives the sprite and the
+    difference between the passes gives the background weight.
+
+    Args:
+        shape: Shape of the frames the widget is drawn on
+        draw: Callable taking a frame and drawing the widget onto it
+        bounds: (x0, y0, x1, y1) region the widget can draw in, or None for the
+                whole frame; drawing outside it is not captured
+
+    Returns:
+        Tuple of (sprite, inv_alpha, x0, y0) for blit_sprite
+    """
+    height, width = shape[:2]
+    if bounds is None:
+        bounds = (0, 0, width, height)
+    bx0, by0 = max(bounds[0], 0), max(bounds[1], 0)
+    bx1, by1 = min(bounds[2], width), min(bounds[3], height)
+
+    canvases = _capture_canvases.get(shape)
+    if canvases is None:
+        canvases = (np.empty(shape, dtype=np.uint8), np.empty(shape, dtype=np.uint8))
+        _capture_canvases[shape] = canvases
+    black_canvas, white_canvas = canvases
+
+    # The widget draws in frame coordinates, so it gets the full canvas, but
+    # only its bounds are cleared beforehand and examined afterwards
+    over_black = black_canvas[by0:by1, bx0:bx1]
+    over_black[:] = 0
+    draw(black_canvas)
+    over_white = white_canvas[by0:by1, bx0:bx1]
+    over_white[:] = 255
+    draw(white_canvas)
+    inv_alpha = cv2.subtract(over_white, over_black)
+
+    # Crop to the pixels the widget touched: any channel that gained color or
+    # lost background weight. The channels are viewed as one wide single-channel
+    # image so cv2.boundingRect can find the extent in one pass
+    touched = cv2.bitwise_or(over_black, cv2.bitwise_not(inv_alpha))
+    rows, cols = touched.shape[:2]
+    x, y, w, h = cv2.boundingRect(touched.reshape(rows, cols * 3))
+    if w == 0:
+        empty = np.zeros((0, 0, 3), dtype=np.uint8)
+        return empty, empty, 0, 0
+    x0, x1, y0, y1 = x // 3, (x + w + 2) // 3, y, y + h
+    return (over_black[y0:y1, x0:x1].copy(), inv_alpha[y0:y1, x0:x1].copy(),
+            x0 + bx0, y0 + by0)
+
+
+def draw_cached_layer(frame, name, key, draw, bounds=None):
+    """
+    Draw a widget, reusing a captured sprite of it while its inputs are unchanged.
+
+    The widget is drawn directly until the same key has been seen on
+    CACHED_LAYER_STABLE_FRAMES frames in a row. It is then captured as a sprite
+    and blitted from then on until the key changes, so a widget whose state
+    keeps changing never pays for the capture.
+
+    Args:
+        frame: BGR frame to draw on
+        name: Key identifying the layer between frames
+        key: Hashable summary of everything the widget's drawing depends on
+        draw: Callable taking a frame and drawing the widget onto it
+        bounds: (x0, y0, x1, y1) region the widget can draw in, or None for the
+                whole frame; keeping it tight keeps the capture cheap
+    """
+    cached = _cached_layers.get(name)
+    if cached is None or cached[0] != key:
+        draw(frame)
+        _cached_layers[name] = (key, 1, None)
+        return
+
+    _, seen, entry = cached
+    if entry is None:
+        seen += 1
+        if seen < CACHED_LAYER_STABLE_FRAMES:
+            draw(frame)
+            _cached_layers[name] = (key, seen, None)
+            return
+        entry = _capture_layer(frame.shape, draw, bounds)
+        _cached_layers[name] = (key, seen, entry)
+    sprite, inv_alpha, x0, y0 = entry
+    blit_sprite(frame, sprite, inv_alpha, x0, y0)
@@ -1,16 +1,25 @@
-import gps
+import json
+import socket
 import threading
-import time
 import logging
+from cpu_affinity import pin_current_thread, SERVICE_CORE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+GPS_POLL_TIMEOUT = 0.2  # Seconds to wait for gpsd data before rechecking stop_event
+GPSD_ADDRESS = ("localhost", 2947)  # Default gpsd host and port
+GPSD_WATCH_COMMAND = b'?WATCH={"enable":true,"json":true}\n'
+GPSD_RECV_SIZE = 4096  # Bytes per socket read; gpsd reports are one JSON object per line
+
 
 def start_gps_tracker_service(shared_state, stop_event):
     """
-    Starts a background thread that polls GPS data using gpsd and writes to SharedState.
+    Starts a background thread that reads GPS reports from gpsd and writes to SharedState.
+    
+    Talks to gpsd's JSON protocol directly over a TCP socket, buffering the
+    stream and decoding one report per line.
     
     Args:
         shared_state: SharedState instance for thread-safe data storage
@@ -20,26 +29,51 @@ def start_gps_tracker_service(shared_state, stop_event):
         The started thread object
     """
     def gps_thread():
+        pin_current_thread(SERVICE_CORE, "GPS")
         retry_delay = 1  # Initial retry delay in seconds
         max_retry_delay = 60  # Maximum retry delay (exponential backoff cap)
         
         while not stop_event.is_set():
+            sock = None
             try:
                 logger.info("[GPS] Connecting to gpsd...")
-                session = gps.gps(mode=gps.WATCH_ENABLE)
+                sock = socket.create_connection(GPSD_ADDRESS, timeout=5)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.sendall(GPSD_WATCH_COMMAND)
+                # Short timeout so stop_event is rechecked promptly between reports
+                sock.settimeout(GPS_POLL_TIMEOUT)
                 logger.info("[GPS] Connected to gpsd successfully")
                 retry_delay = 1  # Reset retry delay on successful connection
                 
+                # Bytes received after the last complete line
+                pending = b""
+                
                 while not stop_event.is_set():
                     try:
-                        report = session.next()
+                        chunk = sock.recv(GPSD_RECV_SIZE)
+                    except socket.timeout:
+                        continue
+                    
+                    if not chunk:
+                        logger.warning("[GPS] GPS session ended, reconnecting...")
+                        break  # Break inner loop to reconnect
+                    
+                    # Split the buffered stream into complete JSON lines
+                    pending += chunk
+                    *lines, pending = pending.split(b"\n")
+                    
+                    for line in lines:
+                        try:
+                            report = json.loads(line)
+                        except ValueError:
+                            continue  # Ignore malformed or partial reports
                         
-                        if report['class'] == 'TPV':
-                            # Extract GPS data from report
-                            lat = report.lat if hasattr(report, 'lat') else None
-                            lon = report.lon if hasattr(report, 'lon') else None
-                            spd = report.speed if hasattr(report, 'speed') else None
-                            track = report.track if hasattr(report, 'track') else None
+                        if report.get('class') == 'TPV':
+                            # Extract GPS data from report (missing fields are None)
+                            lat = report.get('lat')
+                            lon = report.get('lon')
+                            spd = report.get('speed')
+                            track = report.get('track')
                             
                             # Check if IMU heading exists before writing GPS heading
                             imu_data = shared_state.get_imu_data()
@@ -54,28 +88,21 @@ def start_gps_tracker_service(shared_state, stop_event):
                                 speed=spd,
                                 heading=track
                             )
-                            
-                    except KeyError:
-                        pass  # Ignore key errors in the report
-                    except StopIteration:
-                        logger.warning("[GPS] GPS session ended, reconnecting...")
-                        break  # Break inner loop to reconnect
-                    except Exception as e:
-                        logger.error(f"[GPS] Error reading GPS data: {e}")
-                        time.sleep(1)
                         
             except Exception as e:
                 logger.error(f"[GPS] Connection error: {e}")
                 logger.info(f"[GPS] Retrying in {retry_delay} seconds...")
                 
-                # Wait with exponential backoff, but check stop_event periodically
-                for _ in range(retry_delay):
-                    if stop_event.is_set():
-                        break
-                    time.sleep(1)
+                # Wait with exponential backoff, returning immediately on stop_event
+                if stop_event.wait(retry_delay):
+                    break
                 
                 # Exponential backoff with cap
                 retry_delay = min(retry_delay * 2, max_retry_delay)
+            
+            finally:
+                if sock is not None:
+                    sock.close()
         
         logger.info("[GPS] GPS tracker service stopped")
     
@@ -7,16 +7,27 @@ a frame and state snapshot, then renders all HUD elements.
 """
 
 import cv2
+import functools
 import math
 import numpy as np
 import threading
-from collections import deque
-from draw_utils import draw_text, draw_bar
+from collections import OrderedDict, deque
+from draw_utils import draw_text, draw_text_panel, draw_bar, blit_sprite, build_sprite, darken_rect, darken_rects, draw_cached_layer
 from theme import (
     NEON_PINK, NEON_GREEN, NEON_ORANGE, NEON_BLUE, NEON_PURPLE,
     CENTER, RADIUS, FONT, FONT_SCALE, THICKNESS, assign_device_color
 )
 
+try:
+    import pyfftw  # Optional: pre-planned FFTW transforms for the audio visualizer
+except ImportError:
+    pyfftw = None
+
+try:
+    import scipy.fft as scipy_fft  # Optional: pocketfft-based fallback when pyfftw is missing
+except ImportError:
+    scipy_fft = None
+
 # Thread-safe queues for RF overlay events
 _signal_events = deque()
 _scan_updates = deque()
@@ -27,6 +38,212 @@ _rf_lock = threading.Lock()
 _wifi_rotation_index = 0
 _wifi_rotation_lock = threading.Lock()
 
+# Number of frequency bars in the audio visualizer
+NUM_BARS = 60
+
+# Degrees-to-radians factor (same constant math.radians uses)
+_DEG2RAD = math.pi / 180
+
+# Compass direction labels with the cos/sin of their screen angle
+# (0 = right, 90 = down), computed once since they never change
+_COMPASS_DIRECTIONS = [
+    (label, math.cos(angle_deg * _DEG2RAD), math.sin(angle_deg * _DEG2RAD))
+    for label, angle_deg in (
+        ("N", 270), ("NE", 315), ("E", 0), ("SE", 45),
+        ("S", 90), ("SW", 135), ("W", 180), ("NW", 225)
+    )
+]
+
+# cos/sin of the screen angle for each whole compass degree (0 = up, clockwise),
+# used for every point placed around the compass
+_COMPASS_COS = np.cos((90 - np.arange(360)) * _DEG2RAD)
+_COMPASS_SIN = np.sin((90 - np.arange(360)) * _DEG2RAD)
+
+# Peak sample magnitude (in int16 sample units) below which audio is treated
+# as silence and the visualizer is skipped
+AUDIO_SILENCE_PEAK = 8.0
+
+# Number of most recent samples fed to the visualizer FFT (the capture block
+# may be longer). Also the fixed transform size: shorter blocks are zero-padded
+AUDIO_FFT_WINDOW = 1024
+
+# Bar directions around the visualizer circle (fixed, so computed once)
+_BAR_ANGLES = np.radians(np.arange(NUM_BARS) * (360 / NUM_BARS))
+_BAR_COS = np.cos(_BAR_ANGLES)
+_BAR_SIN = np.sin(_BAR_ANGLES)
+# Inner bar endpoints on the circle circumference never move
+_BAR_X1 = CENTER[0] + RADIUS * _BAR_COS
+_BAR_Y1 = CENTER[1] + RADIUS * _BAR_SIN
+
+# Heading-bar redraw resolution: the heading is quantized to 1/10° so sensor
+# jitter below that doesn't invalidate the cached bar
+HEADING_BAR_STEPS_PER_DEGREE = 10
+
+# Frame-size dependent layout positions keyed by frame shape
+_hud_layouts = {}
+
+# Heading-bar tick geometry keyed by (bar_x, bar_width, scale_y)
+_heading_bar_ticks = {}
+
+# Pre-rendered compass ring and direction labels keyed by (center, radius)
+_compass_chrome = {}
+
+# Compass needle tip for each whole degree of heading, keyed by (center, radius)
+_compass_needles = {}
+
+# HUD compass position and ring radius
+COMPASS_CENTER = (100, 600)
+COMPASS_RADIUS = 40
+
+# Baseline origins of the left-hand readout lines: five system metrics lines
+# followed by four GPS lines
+_PANEL_LINE_ORIGINS = tuple((30, 50 + 35 * i) for i in range(9))
+
+# Wi-Fi list: networks shown at once, and the top of each entry row
+WIFI_MAX_DISPLAY = 8
+_WIFI_ENTRY_HEIGHT = 70
+_WIFI_ENTRY_YS = tuple(100 + _WIFI_ENTRY_HEIGHT * i for i in range(WIFI_MAX_DISPLAY))
+
+# Wi-Fi signal bar fill color for each whole signal percentage (rounded up):
+# weak (<= 33%), fair (<= 66%) and strong signals
+_SIGNAL_BAR_COLORS = (NEON_PINK,) * 34 + (NEON_ORANGE,) * 33 + (NEON_GREEN,) * 34
+
+# Pre-rendered device icons keyed by (device_type, size, icon_color, border_color)
+_device_icons = {}
+
+# Font for small outlined labels (distances, SSIDs, channels)
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# Rasterized labels keyed by (text, scale, color, thickness, outline_thickness),
+# least recently used first
+LABEL_SPRITE_CACHE_SIZE = 512
+_label_sprites = OrderedDict()
+
+# Visualizer bars from the last audio block drawn, keyed by (audio_seq, length)
+_visualizer_cache = {"key": None, "segments": None}
+
+# Hann windows (with the int16 -> [-1, 1) scale folded in) keyed by block length
+_fft_windows = {}
+
+# FFTW plans keyed by transform size, and the magnitude scratch buffer they
+# write into (only used when pyfftw is installed)
+_fft_plans = {}
+_fft_bars = np.empty(NUM_BARS, dtype=np.float32)
+
+# Aligned FFT input buffers keyed by transform size (numpy/scipy.fft path)
+_fft_inputs = {}
+
+
+class RFDevice:
+    """
+    One scanned RF device, with the fields the HUD draws from.
+    
+    Scanner results are dictionaries with either upper- or lowercase keys;
+    render_hud converts each one once per frame so the drawing code reads
+    plain attributes instead of repeating the key fallbacks.
+    """
+    __slots__ = ('ssid', 'signal', 'signal_dbm', 'channel', 'device_type', 'distance_m', 'color')
+    
+    def __init__(self, data):
+        get = data.get
+        self.ssid = get('SSID') or get('ssid')
+        self.signal = get('Signal') or get('signal', 'N/A')
+        self.signal_dbm = get('signal_dbm', 0)
+        self.channel = get('Channel') or get('channel', 'N/A')
+        self.device_type = get('device_type', 'unknown')
+        self.distance_m = get('distance_m', 0)
+        self.color = tuple(get('color') or NEON_BLUE)
+
+
+@functools.lru_cache(maxsize=512)
+def _measure_text(text, scale, thickness):
+    """
+    Return the (width, height) of text in the label font, cached.
+    
+    Tick labels, headings and SSID labels repeat from frame to frame, so after
+    the first frame their metrics are a cache lookup instead of a getTextSize call.
+    
+    Args:
+        text: Text to measure
+        scale: Font scale
+        thickness: Stroke thickness
+    
+    Returns:
+        Tuple (width, height) in pixels
+    """
+    return cv2.getTextSize(text, _LABEL_FONT, scale, thickness)[0]
+
+
+def _get_label_sprite(text, scale, color, thickness, outline_thickness):
+    """
+    Return a label rasterized into a cached sprite.
+    
+    Args:
+        text: Text to draw
+        scale: Font scale
+        color: Foreground color in BGR format
+        thickness: Foreground stroke thickness
+        outline_thickness: Thickness of the black outline pass, or 0 for none
+        
+    Returns:
+        Tuple of (sprite, inv_alpha, dx, dy) where (dx, dy) is the offset of the
+        sprite's top-left corner from the text origin
+    """
+    key = (text, scale, color, thickness, outline_thickness)
+    entry = _label_sprites.get(key)
+    if entry is None:
+        pad = max(thickness, outline_thickness)
+        (w, h), baseline = cv2.getTextSize(text, _LABEL_FONT, scale, pad)
+        origin = (pad, pad + h)
+        
+        layers = []
+        if outline_thickness:
+            layers.append((lambda canvas, c: cv2.putText(canvas, text, origin, _LABEL_FONT, scale, c, outline_thickness),
+                           (0, 0, 0)))
+        layers.append((lambda canvas, c: cv2.putText(canvas, text, origin, _LABEL_FONT, scale, c, thickness),
+                       color))
+        
+        sprite, inv_alpha = build_sprite((h + baseline + 2 * pad, w + 2 * pad), layers)
+        entry = (sprite, inv_alpha, -pad, -(pad + h))
+        _label_sprites[key] = entry
+        if len(_label_sprites) > LABEL_SPRITE_CACHE_SIZE:
+            _label_sprites.popitem(last=False)
+    else:
+        _label_sprites.move_to_end(key)
+    return entry
+
+
+def _draw_label(frame, text, origin, scale, color, thickness=1, outline_thickness=0):
+    """
+    Draw HUD text from the label sprite cache.
+    
+    Args:
+        frame: OpenCV frame to draw on
+        text: Text to draw
+        origin: Tuple (x, y) for the text baseline origin
+        scale: Font scale
+        color: Foreground color in BGR format
+        thickness: Foreground stroke thickness
+        outline_thickness: Thickness of the black outline pass, or 0 for none
+    """
+    sprite, inv_alpha, dx, dy = _get_label_sprite(text, scale, tuple(color), thickness, outline_thickness)
+    blit_sprite(frame, sprite, inv_alpha, origin[0] + dx, origin[1] + dy)
+
+
+def _draw_outlined_text(frame, text, origin, scale, color, outline_thickness=2):
+    """
+    Draw small HUD text with a black outline (outline pass, then 1px foreground).
+    
+    Args:
+        frame: OpenCV frame to draw on
+        text: Text to draw
+        origin: Tuple (x, y) for the text baseline origin
+        scale: Font scale
+        color: Foreground color in BGR format
+        outline_thickness: Thickness of the black outline pass
+    """
+    _draw_label(frame, text, origin, scale, color, 1, outline_thickness)
+
 
 def _draw_router_icon(frame, center, size=24, color=(200, 200, 200)):
     """
@@ -104,6 +321,47 @@ def _draw_unknown_icon(frame, center, size=24, color=(200, 200, 200)):
     cv2.circle(frame, (x, y), 2, color, -1)
 
 
+def _get_device_icon(device_type, size, icon_color, border_color):
+    """
+    Return a device icon and its border as a cached sprite.
+    
+    Args:
+        device_type: Type of device ("router", "drone", "unknown")
+        size: Icon size in pixels
+        icon_color: Icon color in BGR format
+        border_color: Border color in BGR format, or None for no border
+        
+    Returns:
+        Tuple of (sprite, inv_alpha, margin) where margin is the offset of the
+        icon center from the sprite's top-left corner
+    """
+    key = (device_type, size, icon_color, border_color)
+    icon = _device_icons.get(key)
+    if icon is None:
+        # Room for the border ring and the drone's propellers past the arm tips
+        margin = size // 2 + size // 8 + 6
+        local_center = (margin, margin)
+        
+        if device_type == "router":
+            draw_icon = _draw_router_icon
+        elif device_type == "drone":
+            draw_icon = _draw_drone_icon
+        else:
+            draw_icon = _draw_unknown_icon
+        
+        layers = []
+        if border_color:
+            # Colored circle behind the icon
+            layers.append((lambda canvas, color: cv2.circle(canvas, local_center, size // 2 + 3, color, 2),
+                           border_color))
+        layers.append((lambda canvas, color: draw_icon(canvas, local_center, size, color), icon_color))
+        
+        sprite, inv_alpha = build_sprite((2 * margin + 1, 2 * margin + 1), layers)
+        icon = (sprite, inv_alpha, margin)
+        _device_icons[key] = icon
+    return icon
+
+
 def _draw_device_icon(frame, center, device_type, size=24, icon_color=(200, 200, 200), border_color=None):
     """
     Draw a device type icon with optional colored border.
@@ -116,84 +374,230 @@ def _draw_device_icon(frame, center, device_type, size=24, icon_color=(200, 200,
         icon_color: Icon color in BGR format (white/light gray)
         border_color: Optional border color in BGR format (device's unique color)
     """
-    # Draw colored border/highlight if provided
-    if border_color:
-        # Draw a colored circle behind the icon
-        cv2.circle(frame, center, size // 2 + 3, border_color, 2)
-    
-    # Draw the appropriate icon
-    if device_type == "router":
-        _draw_router_icon(frame, center, size, icon_color)
-    elif device_type == "drone":
-        _draw_drone_icon(frame, center, size, icon_color)
-    else:
-        _draw_unknown_icon(frame, center, size, icon_color)
+    sprite, inv_alpha, margin = _get_device_icon(
+        device_type, size, tuple(icon_color), tuple(border_color) if border_color else None)
+    blit_sprite(frame, sprite, inv_alpha, center[0] - margin, center[1] - margin)
 
 
 def _normalize_angle(angle):
     """Normalize angle to 0-360 range."""
-    while angle < 0:
-        angle += 360
-    while angle >= 360:
-        angle -= 360
-    return angle
+    return angle % 360
+
+
+def _device_bearings(rf_devices, wifi_directions):
+    """
+    Join scanned devices with their estimated directions, as parallel arrays.
+    
+    Built once per frame and shared by the heading bar and compass, so the
+    per-device dictionary lookups happen in one place.
+    
+    Args:
+        rf_devices: List of RFDevice
+        wifi_directions: Dictionary of SSID -> {direction_deg, confidence}
+        
+    Returns:
+        Tuple of (devices, directions, confidences): the devices that have a
+        direction estimate, and float64 arrays of their direction in degrees
+        and its confidence
+    """
+    devices = []
+    directions = []
+    confidences = []
+    if wifi_directions:
+        for device in rf_devices:
+            ssid = device.ssid
+            if ssid and ssid in wifi_directions:
+                direction_data = wifi_directions[ssid]
+                direction_deg = direction_data.get('direction_deg')
+                if direction_deg is not None:
+                    devices.append(device)
+                    directions.append(direction_deg)
+                    confidences.append(direction_data.get('confidence', 0))
+    
+    return (devices, np.array(directions, dtype=np.float64),
+            np.array(confidences, dtype=np.float64))
+
+
+def _visible_bearings(bearings, heading):
+    """
+    Return the confident devices whose bearing falls within the heading bar's ±60°.
+    
+    Args:
+        bearings: (devices, directions, confidences) from _device_bearings
+        heading: Current heading in degrees
+        
+    Returns:
+        List of {device, relative_deg, direction_deg} dictionaries sorted by
+        relative_deg
+    """
+    devices, directions, confidences = bearings
+    
+    # Relative bearing in the -180..180 range
+    relative = (directions - heading + 180) % 360 - 180
+    visible = np.flatnonzero((confidences > 0.3) & (np.abs(relative) <= 60))
+    order = visible[np.argsort(relative[visible], kind='stable')]
+    
+    return [
+        {
+            'device': devices[i],
+            'relative_deg': rel,
+            'direction_deg': direction_deg
+        }
+        for i, rel, direction_deg in zip(order.tolist(), relative[order].tolist(), directions[order].tolist())
+    ]
+
+
+def _get_layout(shape):
+    """
+    Return the frame-size dependent layout positions, computed once per shape.
+    
+    Args:
+        shape: Frame shape tuple
+        
+    Returns:
+        Dictionary with the heading bar's bar_width and bar_x, the Wi-Fi
+        list's list_x, and the (x0, y0, x1, y1) region each cached widget
+        can draw in (heading_bar_bounds, compass_bounds, wifi_list_bounds)
+    """
+    layout = _hud_layouts.get(shape)
+    if layout is None:
+        frame_height, frame_width = shape[:2]
+        bar_width = int(frame_width * 0.8)
+        bar_x = (frame_width - bar_width) // 2
+        list_x = frame_width - 350  # Position from right edge
+        
+        compass_x, compass_y = COMPASS_CENTER
+        
+        layout = {
+            'bar_width': bar_width,
+            'bar_x': bar_x,
+            'list_x': list_x,
+            # The bar spans y 10-70; device icons and distance labels sit above
+            # it and can overhang its ends by half a label
+            'heading_bar_bounds': (bar_x - 60, 0, bar_x + bar_width + 60, 80),
+            # Ring labels extend up to 50px past the ring, then text stacks
+            # downward from there; _compass_bounds widens x1 by the widest label
+            'compass_bounds': (0, compass_y - COMPASS_RADIUS - 80,
+                               compass_x + COMPASS_RADIUS + 70, frame_height),
+            'wifi_list_bounds': (list_x - 15, 0, frame_width, frame_height),
+        }
+        _hud_layouts[shape] = layout
+    return layout
+
+
+def _group_stacks(items, values, threshold):
+    """
+    Split items into stacks wherever consecutive values differ by more than threshold.
+    
+    Args:
+        items: List of items, sorted by value
+        values: The sorted value for each item (e.g. bearing in degrees)
+        threshold: Largest gap between neighbours that keeps them in one stack
+        
+    Returns:
+        List of stacks, each a list of items
+    """
+    if not items:
+        return []
+    # A new stack starts after every gap wider than the threshold
+    breaks = (np.flatnonzero(np.diff(np.asarray(values, dtype=np.float64)) > threshold) + 1).tolist()
+    return [items[start:end] for start, end in zip([0] + breaks, breaks + [len(items)])]
+
+
+def _ring_points(directions, center, radius):
+    """
+    Return integer (x, y) points on a circle for compass directions in degrees.
+    
+    Directions are rounded to the nearest degree and looked up in the compass
+    cos/sin tables.
+    
+    Args:
+        directions: Compass directions in degrees (0 = up, clockwise)
+        center: Tuple (x, y) for the circle center
+        radius: Circle radius in pixels
+        
+    Returns:
+        List of (x, y) integer tuples
+    """
+    idx = np.rint(np.asarray(directions, dtype=np.float64)).astype(np.intp) % 360
+    xs = (center[0] + radius * _COMPASS_COS[idx]).astype(np.int32)
+    ys = (center[1] - radius * _COMPASS_SIN[idx]).astype(np.int32)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+def _get_heading_bar_ticks(bar_x, bar_width, scale_y):
+    """
+    Return the heading-bar tick geometry, computed once per bar layout.
+    
+    Tick positions depend only on the bar's placement, not on the heading,
+    since the scale always shows heading ±60° in 5° steps.
+    
+    Args:
+        bar_x: Left edge of the bar in pixels
+        bar_width: Width of the bar in pixels
+        scale_y: Baseline y coordinate of the tick marks
+    
+    Returns:
+        Tuple of (pixels_per_degree, tick_segments, major_ticks) where
+        tick_segments is an int32 (25, 2, 2) array for cv2.polylines and
+        major_ticks is a list of (deg_offset, x_pos) for the labeled ticks
+    """
+    key = (bar_x, bar_width, scale_y)
+    ticks = _heading_bar_ticks.get(key)
+    if ticks is None:
+        pixels_per_degree = bar_width / 120  # Total visible range
+        segments = []
+        major_ticks = []
+        for deg_offset in range(-60, 61, 5):
+            x_pos = bar_x + int((deg_offset + 60) * pixels_per_degree)
+            if deg_offset % 10 == 0:
+                tick_height = 10
+                major_ticks.append((deg_offset, x_pos))
+            else:
+                tick_height = 5
+            segments.append(((x_pos, scale_y), (x_pos, scale_y - tick_height)))
+        ticks = (pixels_per_degree, np.array(segments, dtype=np.int32), major_ticks)
+        _heading_bar_ticks[key] = ticks
+    return ticks
 
 
-def _draw_heading_bar(frame, heading, rf_devices, wifi_directions):
+def _draw_heading_bar(frame, heading, bearings, layout):
     """
     Draw heading readout bar at the top of the frame.
     
     Args:
         frame: OpenCV frame to draw on
         heading: Current heading in degrees (0-360), or None
-        rf_devices: List of RF device dictionaries with device_type, distance_m, color, ssid
-        wifi_directions: Dictionary of SSID -> {direction_deg, confidence}
+        bearings: (devices, directions, confidences) from _device_bearings
+        layout: Layout positions from _get_layout
     """
     if heading is None:
         heading = 0  # Default to north if no heading available
     
-    frame_height, frame_width = frame.shape[:2]
-    
     # Bar dimensions
     bar_height = 60
-    bar_width = int(frame_width * 0.8)
-    bar_x = (frame_width - bar_width) // 2
+    bar_width = layout['bar_width']
+    bar_x = layout['bar_x']
     bar_y = 10
     
     # Draw semi-transparent background
-    overlay = frame.copy()
-    cv2.rectangle(overlay, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    darken_rect(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height))
     
     # Draw neon cyan border
     cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), NEON_BLUE, 2)
     
-    # Calculate visible degree range (heading ±60°)
-    degree_range = 120  # Total visible range
-    min_deg = heading - 60
-    max_deg = heading + 60
-    
-    # Draw degree scale
+    # Draw degree scale (visible range is heading ±60°)
     scale_y = bar_y + bar_height - 15
-    pixels_per_degree = bar_width / degree_range
-    
-    # Draw tick marks and labels
-    for deg_offset in range(-60, 61, 5):
-        current_deg = _normalize_angle(heading + deg_offset)
-        x_pos = bar_x + int((deg_offset + 60) * pixels_per_degree)
-        
-        # Major ticks every 10°, minor ticks every 5°
-        if deg_offset % 10 == 0:
-            tick_height = 10
-            # Draw degree label
-            label = f"{int(current_deg)}°"
-            text_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.3, 1)[0]
-            cv2.putText(frame, label, (x_pos - text_size[0] // 2, scale_y - 12), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.3, NEON_BLUE, 1)
-        else:
-            tick_height = 5
-        
-        cv2.line(frame, (x_pos, scale_y), (x_pos, scale_y - tick_height), NEON_BLUE, 1)
+    pixels_per_degree, tick_segments, major_ticks = _get_heading_bar_ticks(bar_x, bar_width, scale_y)
+    
+    # Draw all tick marks (major every 10°, minor every 5°) in one call
+    cv2.polylines(frame, tick_segments, False, NEON_BLUE, 1)
+    
+    # Draw degree labels on the major ticks
+    for deg_offset, x_pos in major_ticks:
+        label = f"{int(_normalize_angle(heading + deg_offset))}°"
+        text_size = _measure_text(label, 0.3, 1)
+        _draw_label(frame, label, (x_pos - text_size[0] // 2, scale_y - 12), 0.3, NEON_BLUE)
     
     # Draw cardinal direction markers
     cardinals = [("N", 0), ("E", 90), ("S", 180), ("W", 270)]
@@ -201,10 +605,7 @@ def _draw_heading_bar(frame, heading, rf_devices, wifi_directions):
         # Calculate position relative to current heading
         relative_deg = cardinal_deg - heading
         # Normalize to -180 to 180 range
-        while relative_deg > 180:
-            relative_deg -= 360
-        while relative_deg < -180:
-            relative_deg += 360
+        relative_deg = (relative_deg + 180) % 360 - 180
         
         # Only draw if within visible range
         if -60 <= relative_deg <= 60:
@@ -218,59 +619,19 @@ def _draw_heading_bar(frame, heading, rf_devices, wifi_directions):
     
     # Digital heading readout
     heading_text = f"{int(heading):03d}°"
-    text_size = cv2.getTextSize(heading_text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+    text_size = _measure_text(heading_text, 0.8, 2)
     text_x = center_x - text_size[0] // 2
     text_y = bar_y + 20
     cv2.putText(frame, heading_text, (text_x, text_y), 
                cv2.FONT_HERSHEY_SIMPLEX, 0.8, NEON_GREEN, 2)
     
     # Position RF device icons at their relative bearing
-    if rf_devices and wifi_directions:
-        # Collect devices with direction information
-        devices_with_direction = []
-        for device in rf_devices:
-            ssid = device.get('SSID') or device.get('ssid')
-            if ssid and ssid in wifi_directions:
-                direction_data = wifi_directions[ssid]
-                direction_deg = direction_data.get('direction_deg')
-                confidence = direction_data.get('confidence', 0)
-                
-                if direction_deg is not None and confidence > 0.3:
-                    # Calculate relative bearing
-                    relative_deg = direction_deg - heading
-                    while relative_deg > 180:
-                        relative_deg -= 360
-                    while relative_deg < -180:
-                        relative_deg += 360
-                    
-                    # Only include if within visible range
-                    if -60 <= relative_deg <= 60:
-                        devices_with_direction.append({
-                            'device': device,
-                            'relative_deg': relative_deg,
-                            'direction_deg': direction_deg
-                        })
-        
-        # Sort by relative degree for stacking logic
-        devices_with_direction.sort(key=lambda d: d['relative_deg'])
-        
-        # Implement icon stacking for devices within 5° of each other
-        stacks = []
-        current_stack = []
-        
-        for item in devices_with_direction:
-            if not current_stack:
-                current_stack.append(item)
-            else:
-                # Check if within 5° of the last device in current stack
-                if abs(item['relative_deg'] - current_stack[-1]['relative_deg']) <= 5:
-                    current_stack.append(item)
-                else:
-                    stacks.append(current_stack)
-                    current_stack = [item]
+    if bearings[0]:
+        devices_with_direction = _visible_bearings(bearings, heading)
         
-        if current_stack:
-            stacks.append(current_stack)
+        # Stack icons for devices within 5° of each other
+        stacks = _group_stacks(devices_with_direction,
+                               [item['relative_deg'] for item in devices_with_direction], 5)
         
         # Draw each stack
         icon_size = 24
@@ -288,13 +649,18 @@ def _draw_heading_bar(frame, heading, rf_devices, wifi_directions):
                 icon_y = icon_y_base - (i * stack_spacing)
                 
                 # Get device properties
-                device_type = device.get('device_type', 'unknown')
-                device_color = device.get('color', NEON_BLUE)
-                distance_m = device.get('distance_m', 0)
+                device_type = device.device_type
+                device_color = device.color
+                distance_m = device.distance_m
+                
+                # Icons stacked past the top edge (with their distance label)
+                # are skipped; only their connecting line can reach the frame
+                on_screen = icon_y + icon_size // 2 + 16 >= 0
                 
                 # Draw device icon with colored border
-                _draw_device_icon(frame, (x_pos, icon_y), device_type, icon_size, 
-                                (200, 200, 200), device_color)
+                if on_screen:
+                    _draw_device_icon(frame, (x_pos, icon_y), device_type, icon_size, 
+                                    (200, 200, 200), device_color)
                 
                 # Draw connecting line from icon to scale position (if stacked)
                 if len(stack) > 1:
@@ -303,21 +669,52 @@ def _draw_heading_bar(frame, heading, rf_devices, wifi_directions):
                             (scale_x, scale_y), device_color, 1)
                 
                 # Display distance estimate below icon
-                if distance_m > 0:
+                if on_screen and distance_m > 0:
                     if distance_m < 1000:
                         distance_text = f"~{int(distance_m)}m"
                     else:
                         distance_text = f"~{distance_m/1000:.1f}km"
                     
-                    text_size = cv2.getTextSize(distance_text, cv2.FONT_HERSHEY_SIMPLEX, 0.3, 1)[0]
+                    text_size = _measure_text(distance_text, 0.3, 1)
                     text_x = x_pos - text_size[0] // 2
                     text_y = icon_y + icon_size // 2 + 12
                     
                     # Draw text with outline for visibility
-                    cv2.putText(frame, distance_text, (text_x, text_y), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.3, (0, 0, 0), 2)
-                    cv2.putText(frame, distance_text, (text_x, text_y), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.3, device_color, 1)
+                    _draw_outlined_text(frame, distance_text, (text_x, text_y), 0.3, device_color)
+
+
+def _quantize_heading(heading):
+    """
+    Snap a heading down to the heading bar's redraw resolution.
+    
+    Flooring (rather than rounding) keeps the whole-degree readout identical
+    to the raw heading's, and the wrap keeps it below 360.
+    
+    Args:
+        heading: Heading in degrees (0-360)
+        
+    Returns:
+        Heading quantized to 1/HEADING_BAR_STEPS_PER_DEGREE degree
+    """
+    return math.floor(heading * HEADING_BAR_STEPS_PER_DEGREE) / HEADING_BAR_STEPS_PER_DEGREE % 360
+
+
+def _device_state_key(bearings):
+    """
+    Summarize the device fields the heading bar and compass draw from.
+    
+    Args:
+        bearings: (devices, directions, confidences) from _device_bearings
+        
+    Returns:
+        Hashable tuple that changes whenever either widget's device drawing would
+    """
+    devices, directions, confidences = bearings
+    fields = tuple(
+        (device.ssid, device.device_type, device.color, device.distance_m, device.signal_dbm)
+        for device in devices
+    )
+    return fields, directions.tobytes(), confidences.tobytes()
 
 
 def render_hud(frame, state_snapshot):
@@ -331,6 +728,8 @@ def render_hud(frame, state_snapshot):
     Returns:
         Modified frame with all HUD elements rendered
     """
+    layout = _get_layout(frame.shape)
+    
     # Get heading from IMU first, fall back to GPS
     imu_data = state_snapshot.get('imu', {})
     gps_data = state_snapshot.get('gps', {})
@@ -338,22 +737,33 @@ def render_hud(frame, state_snapshot):
     if heading is None:
         heading = gps_data.get('heading')
     
-    # Render heading readout bar (top center)
-    rf_devices = state_snapshot.get('wifi_networks', [])
-    wifi_directions = state_snapshot.get('wifi_directions', {})
-    _draw_heading_bar(frame, heading, rf_devices, wifi_directions)
+    # Normalize the scanned devices once for every widget that draws them
+    rf_devices = [RFDevice(device) for device in state_snapshot.get('wifi_networks', [])]
+    bearings = _device_bearings(rf_devices, state_snapshot.get('wifi_directions', {}))
+    device_key = _device_state_key(bearings)
+    
+    # Render heading readout bar (top center), reused while heading and devices are unchanged
+    if heading is not None:
+        heading = _quantize_heading(heading)
+    draw_cached_layer(
+        frame, "heading_bar",
+        (heading, frame.shape, device_key),
+        lambda canvas: _draw_heading_bar(canvas, heading, bearings, layout),
+        layout['heading_bar_bounds']
+    )
     
     # Render system metrics (left side)
     _render_system_metrics(frame, state_snapshot.get('system_metrics', {}))
     
     # Render GPS info and compass (left side, below metrics)
-    _render_gps_info(frame, state_snapshot)
+    _render_gps_info(frame, state_snapshot, bearings, device_key)
     
     # Render Wi-Fi networks (right side)
-    _render_wifi_networks(frame, state_snapshot)
+    _render_wifi_networks(frame, rf_devices, layout)
     
     # Render audio visualizer (center)
-    _render_audio_visualizer(frame, state_snapshot.get('audio_buffer'))
+    _render_audio_visualizer(frame, state_snapshot.get('audio_buffer'),
+                             state_snapshot.get('audio_seq'))
     
     # Render RF overlays (bottom left)
     _render_rf_overlays(frame)
@@ -361,50 +771,95 @@ def render_hud(frame, state_snapshot):
     return frame
 
 
-def _render_system_metrics(frame, metrics):
+@functools.lru_cache(maxsize=1, typed=True)
+def _system_metrics_items(cpu, ram, temp, net_sent, net_recv):
     """
-    Renders system metrics on the left side of the HUD.
+    Format the system metrics panel lines for draw_text_panel.
     
-    Args:
-        frame: OpenCV frame to draw on
-        metrics: Dictionary with CPU, RAM, Temp, Net_Sent, Net_Recv
+    Memoized on the raw values, so frames between metric updates (about 1 Hz)
+    reuse the previous lines without formatting anything.
     """
-    x, y, spacing = 30, 50, 35
-    
     # CPU usage
-    cpu = metrics.get('cpu_percent', 'N/A')
     cpu_text = f"CPU: {cpu}%" if isinstance(cpu, (int, float)) else f"CPU: {cpu}"
-    draw_text(frame, cpu_text, (x, y), NEON_PINK)
     
     # RAM usage
-    ram = metrics.get('ram_percent', 'N/A')
     ram_text = f"RAM: {ram}%" if isinstance(ram, (int, float)) else f"RAM: {ram}"
-    draw_text(frame, ram_text, (x, y + spacing), NEON_GREEN)
     
     # Temperature
-    temp = metrics.get('temp_celsius', 'N/A')
     temp_text = f"Temp: {temp}°C" if temp != 'N/A' else "Temp: N/A"
-    draw_text(frame, temp_text, (x, y + spacing * 2), NEON_ORANGE)
     
-    # Network sent
-    net_sent = metrics.get('net_sent_kb', 0)
-    draw_text(frame, f"Net ↑: {net_sent:.1f} KB", (x, y + spacing * 3), NEON_BLUE)
+    origins = _PANEL_LINE_ORIGINS
+    return (
+        (cpu_text, origins[0], NEON_PINK),
+        (ram_text, origins[1], NEON_GREEN),
+        (temp_text, origins[2], NEON_ORANGE),
+        (f"Net ↑: {net_sent:.1f} KB", origins[3], NEON_BLUE),
+        (f"Net ↓: {net_recv:.1f} KB", origins[4], NEON_PURPLE),
+    )
+
+
+def _render_system_metrics(frame, metrics):
+    """
+    Renders system metrics on the left side of the HUD.
     
-    # Network received
-    net_recv = metrics.get('net_recv_kb', 0)
-    draw_text(frame, f"Net ↓: {net_recv:.1f} KB", (x, y + spacing * 4), NEON_PURPLE)
+    Args:
+        frame: OpenCV frame to draw on
+        metrics: Dictionary with CPU, RAM, Temp, Net_Sent, Net_Recv
+    """
+    items = _system_metrics_items(
+        metrics.get('cpu_percent', 'N/A'),
+        metrics.get('ram_percent', 'N/A'),
+        metrics.get('temp_celsius', 'N/A'),
+        metrics.get('net_sent_kb', 0),
+        metrics.get('net_recv_kb', 0)
+    )
+    
+    # Metrics change about once a second, so draw them as one cached panel
+    draw_text_panel(frame, "system_metrics", items)
 
 
-def _render_gps_info(frame, state_snapshot):
+@functools.lru_cache(maxsize=1, typed=True)
+def _gps_info_items(heading, lat, lon, speed):
+    """
+    Format the GPS readout panel lines for draw_text_panel.
+    
+    Memoized on the raw values, so frames between GPS fixes reuse the
+    previous lines without formatting anything.
+    """
+    # Display heading
+    if heading is not None:
+        heading_text = f"Heading: {heading:.1f}°"
+    else:
+        heading_text = "Heading: N/A"
+    
+    # Display latitude
+    lat_text = f"Lat: {lat:.6f}" if lat is not None else "Lat: N/A"
+    
+    # Display longitude
+    lon_text = f"Lon: {lon:.6f}" if lon is not None else "Lon: N/A"
+    
+    # Display speed
+    speed_text = f"Speed: {speed:.2f} m/s" if speed is not None else "Speed: N/A"
+    
+    origins = _PANEL_LINE_ORIGINS
+    return (
+        (heading_text, origins[5], NEON_GREEN),
+        (lat_text, origins[6], NEON_BLUE),
+        (lon_text, origins[7], NEON_BLUE),
+        (speed_text, origins[8], NEON_BLUE),
+    )
+
+
+def _render_gps_info(frame, state_snapshot, bearings, device_key):
     """
     Renders GPS information and compass on the left side below system metrics.
     
     Args:
         frame: OpenCV frame to draw on
         state_snapshot: Complete state snapshot containing GPS and IMU data
+        bearings: (devices, directions, confidences) from _device_bearings
+        device_key: _device_state_key for bearings
     """
-    x, y, spacing = 30, 50, 35
-    
     # Get heading from IMU first, fall back to GPS
     imu_data = state_snapshot.get('imu', {})
     gps_data = state_snapshot.get('gps', {})
@@ -413,126 +868,187 @@ def _render_gps_info(frame, state_snapshot):
     if heading is None:
         heading = gps_data.get('heading')
     
-    # Display heading
-    if heading is not None:
-        draw_text(frame, f"Heading: {heading:.1f}°", (x, y + spacing * 5), NEON_GREEN)
-    else:
-        draw_text(frame, "Heading: N/A", (x, y + spacing * 5), NEON_GREEN)
+    items = _gps_info_items(
+        heading,
+        gps_data.get('latitude'),
+        gps_data.get('longitude'),
+        gps_data.get('speed')
+    )
     
-    # Display latitude
-    lat = gps_data.get('latitude')
-    if lat is not None:
-        draw_text(frame, f"Lat: {lat:.6f}", (x, y + spacing * 6), NEON_BLUE)
-    else:
-        draw_text(frame, "Lat: N/A", (x, y + spacing * 6), NEON_BLUE)
+    # GPS fixes arrive at a few Hz, so draw the readouts as one cached panel
+    draw_text_panel(frame, "gps_info", items)
     
-    # Display longitude
-    lon = gps_data.get('longitude')
-    if lon is not None:
-        draw_text(frame, f"Lon: {lon:.6f}", (x, y + spacing * 7), NEON_BLUE)
-    else:
-        draw_text(frame, "Lon: N/A", (x, y + spacing * 7), NEON_BLUE)
+    # Draw compass with enhanced indicators (the needle moves in whole degrees,
+    # so the compass is reused until the rounded heading or devices change)
+    compass_heading = heading if heading is not None else 0
+    draw_cached_layer(
+        frame, "compass",
+        (round(compass_heading), frame.shape, device_key),
+        lambda canvas: _draw_compass(canvas, compass_heading, bearings),
+        _compass_bounds(frame.shape, bearings)
+    )
+
+
+def _compass_label_text(ssid, distance_m):
+    """
+    Format a compass label: the SSID followed by its distance estimate, if any.
     
-    # Display speed
-    speed = gps_data.get('speed')
-    if speed is not None:
-        draw_text(frame, f"Speed: {speed:.2f} m/s", (x, y + spacing * 8), NEON_BLUE)
-    else:
-        draw_text(frame, "Speed: N/A", (x, y + spacing * 8), NEON_BLUE)
+    Args:
+        ssid: Network SSID
+        distance_m: Estimated distance in meters (0 = unknown)
+        
+    Returns:
+        Label string
+    """
+    if distance_m <= 0:
+        return f"{ssid}"
+    if distance_m < 1000:
+        return f"{ssid} ~{int(distance_m)}m"
+    return f"{ssid} ~{distance_m/1000:.1f}km"
+
+
+def _compass_bounds(shape, bearings):
+    """
+    Return the region the compass can draw in for these devices.
     
-    # Draw compass with enhanced indicators
-    compass_heading = heading if heading is not None else 0
-    rf_devices = state_snapshot.get('wifi_networks', [])
-    wifi_directions = state_snapshot.get('wifi_directions', {})
-    _draw_compass(frame, compass_heading, wifi_directions, rf_devices)
+    Labels are drawn untruncated to the right of the ring, so the right edge
+    is widened by the widest label, measured at its outline thickness (the
+    outline pass makes long labels wider than their background).
+    
+    Args:
+        shape: Frame shape tuple
+        bearings: (devices, directions, confidences) from _device_bearings
+        
+    Returns:
+        Tuple (x0, y0, x1, y1)
+    """
+    x0, y0, x1, y1 = _get_layout(shape)['compass_bounds']
+    label_width = max(
+        (_measure_text(_compass_label_text(device.ssid, device.distance_m), 0.35, 2)[0]
+         for device in bearings[0]),
+        default=0
+    )
+    return x0, y0, x1 + label_width, y1
 
 
-def _draw_compass(frame, heading, wifi_directions, rf_devices=None, center=(100, 600), radius=40):
+def _get_compass_chrome(center, radius):
+    """
+    Return the static compass ring and direction labels as a cached sprite.
+    
+    Args:
+        center: Tuple (x, y) for compass center
+        radius: Radius of the compass circle
+        
+    Returns:
+        Tuple of (sprite, inv_alpha, x0, y0) for draw_utils.blit_sprite
+    """
+    key = (center, radius)
+    chrome = _compass_chrome.get(key)
+    if chrome is None:
+        # Room for the ring plus the labels drawn just outside it
+        margin = radius + 40
+        x0, y0 = center[0] - margin, center[1] - margin
+        size = (2 * margin + 1, 2 * margin + 1)
+        local_center = (center[0] - x0, center[1] - y0)
+        label_origins = [
+            (int(center[0] + (radius + 10) * cos_a) - x0 - 10,
+             int(center[1] + (radius + 10) * sin_a) - y0 + 5)
+            for _, cos_a, sin_a in _COMPASS_DIRECTIONS
+        ]
+        
+        def draw_ring(canvas, color):
+            cv2.circle(canvas, local_center, radius, color, 2)
+        
+        def draw_labels(canvas, color):
+            for (label, _, _), origin in zip(_COMPASS_DIRECTIONS, label_origins):
+                cv2.putText(canvas, label, origin, cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
+        
+        sprite, inv_alpha = build_sprite(size, [(draw_ring, NEON_BLUE), (draw_labels, NEON_PINK)])
+        chrome = (sprite, inv_alpha, x0, y0)
+        _compass_chrome[key] = chrome
+    return chrome
+
+
+def _get_compass_needle(center, radius):
+    """
+    Return the compass needle tip for every whole degree of heading.
+    
+    Args:
+        center: Tuple (x, y) for compass center
+        radius: Radius of the compass circle
+        
+    Returns:
+        List of 360 (x, y) integer tuples indexed by heading in degrees
+    """
+    key = (center, radius)
+    needle = _compass_needles.get(key)
+    if needle is None:
+        xs = (center[0] + radius * _COMPASS_COS).astype(np.int32)
+        ys = (center[1] - radius * _COMPASS_SIN).astype(np.int32)
+        needle = list(zip(xs.tolist(), ys.tolist()))
+        _compass_needles[key] = needle
+    return needle
+
+
+def _draw_compass(frame, heading, bearings=None, center=COMPASS_CENTER, radius=COMPASS_RADIUS):
     """
     Draws a compass with heading indicator and enhanced Wi-Fi direction indicators.
     
     Args:
         frame: OpenCV frame to draw on
         heading: Current heading in degrees
-        wifi_directions: Dictionary of SSID -> {direction_deg, confidence}
-        rf_devices: List of RF device dictionaries with device_type, distance_m, color, ssid
+        bearings: (devices, directions, confidences) from _device_bearings
         center: Tuple (x, y) for compass center
         radius: Radius of the compass circle
     """
-    # Draw compass circle
-    cv2.circle(frame, center, radius, NEON_BLUE, 2)
-    
-    # Direction markers and angles
-    directions = [
-        ("N", 270), ("NE", 315), ("E", 0), ("SE", 45),
-        ("S", 90), ("SW", 135), ("W", 180), ("NW", 225)
-    ]
+    # Blit the pre-rendered compass circle and direction markers
+    sprite, inv_alpha, x0, y0 = _get_compass_chrome(center, radius)
+    blit_sprite(frame, sprite, inv_alpha, x0, y0)
     
-    for label, angle_deg in directions:
-        angle_rad = math.radians(angle_deg)
-        x = int(center[0] + (radius + 10) * math.cos(angle_rad))
-        y = int(center[1] + (radius + 10) * math.sin(angle_rad))
-        cv2.putText(frame, label, (x - 10, y + 5), cv2.FONT_HERSHEY_SIMPLEX, 0.4, NEON_PINK, 1)
-    
-    # Draw heading needle
-    angle_rad = math.radians(-heading + 90)  # Offset so 0 degrees points up
-    x2 = int(center[0] + radius * math.cos(angle_rad))
-    y2 = int(center[1] - radius * math.sin(angle_rad))
-    cv2.line(frame, center, (x2, y2), NEON_GREEN, 2)
+    # Draw heading needle (rounded to the nearest degree)
+    tip = _get_compass_needle(center, radius)[int(round(heading)) % 360]
+    cv2.line(frame, center, tip, NEON_GREEN, 2)
     
     # Draw enhanced Wi-Fi direction indicators with device types and stacking
-    if rf_devices and wifi_directions:
-        # Collect devices with direction information
+    if bearings is not None and bearings[0]:
+        devices, directions, confidences = bearings
+        frame_height, frame_width = frame.shape[:2]
+        
+        # Confident devices, sorted by direction for stacking logic
+        confident = np.flatnonzero(confidences > 0.3)
+        order = confident[np.argsort(directions[confident], kind='stable')].tolist()
         devices_with_direction = []
-        for device in rf_devices:
-            ssid = device.get('SSID') or device.get('ssid')
-            if ssid and ssid in wifi_directions:
-                direction_data = wifi_directions[ssid]
-                direction_deg = direction_data.get('direction_deg')
-                confidence = direction_data.get('confidence', 0)
-                
-                if direction_deg is not None and confidence > 0.3:
-                    # Get device properties
-                    device_type = device.get('device_type', 'unknown')
-                    device_color = device.get('color', NEON_BLUE)
-                    distance_m = device.get('distance_m', 0)
-                    signal_dbm = device.get('signal_dbm', 0)
-                    
-                    devices_with_direction.append({
-                        'ssid': ssid,
-                        'direction_deg': direction_deg,
-                        'confidence': confidence,
-                        'device_type': device_type,
-                        'device_color': device_color,
-                        'distance_m': distance_m,
-                        'signal_dbm': signal_dbm
-                    })
-        
-        # Sort by direction for stacking logic
-        devices_with_direction.sort(key=lambda d: d['direction_deg'])
-        
-        # Implement label stacking for devices within 15° on compass
-        stacks = []
-        current_stack = []
-        
-        for item in devices_with_direction:
-            if not current_stack:
-                current_stack.append(item)
-            else:
-                # Check if within 15° of the last device in current stack
-                if abs(item['direction_deg'] - current_stack[-1]['direction_deg']) <= 15:
-                    current_stack.append(item)
-                else:
-                    stacks.append(current_stack)
-                    current_stack = [item]
+        for i in order:
+            device = devices[i]
+            devices_with_direction.append({
+                'ssid': device.ssid,
+                'direction_deg': directions.item(i),
+                'confidence': confidences.item(i),
+                'device_type': device.device_type,
+                'device_color': device.color,
+                'distance_m': device.distance_m,
+                'signal_dbm': device.signal_dbm
+            })
+        
+        sorted_directions = directions[order]
         
-        if current_stack:
-            stacks.append(current_stack)
+        # Position of each device on the compass ring
+        ring_points = _ring_points(sorted_directions, center, radius - 5)
+        for item, ring_point in zip(devices_with_direction, ring_points):
+            item['ring_point'] = ring_point
+        
+        # Stack labels for devices within 15° on compass
+        stacks = _group_stacks(devices_with_direction, sorted_directions, 15)
         
         # Draw each stack
         icon_size = 20  # Smaller icons for compass
         label_spacing = 25  # Vertical spacing between stacked labels
         
+        # Label backgrounds are darkened together once every stack is laid out,
+        # then the leader lines and text are drawn on top
+        label_backgrounds = []
+        labels = []
+        
         for stack in stacks:
             # Sort stack by signal strength (prioritize closer/stronger signals at top)
             stack.sort(key=lambda d: d['signal_dbm'], reverse=True)
@@ -540,47 +1056,29 @@ def _draw_compass(frame, heading, wifi_directions, rf_devices=None, center=(100,
             # Calculate average direction for the stack
             avg_direction = sum(item['direction_deg'] for item in stack) / len(stack)
             
-            # Convert direction to compass coordinates
-            angle_rad = math.radians(-avg_direction + 90)
+            # Convert direction to a compass table index
+            angle_idx = int(round(avg_direction)) % 360
             
             # Draw icon on compass ring for each device
             for i, item in enumerate(stack):
-                # Position on compass ring
-                item_angle_rad = math.radians(-item['direction_deg'] + 90)
-                indicator_radius = radius - 5
-                x_ring = int(center[0] + indicator_radius * math.cos(item_angle_rad))
-                y_ring = int(center[1] - indicator_radius * math.sin(item_angle_rad))
-                
                 # Draw device icon on compass ring
-                _draw_device_icon(frame, (x_ring, y_ring), item['device_type'], 
+                _draw_device_icon(frame, item['ring_point'], item['device_type'], 
                                 icon_size, (200, 200, 200), item['device_color'])
             
             # Draw stacked labels outside the compass
             label_radius = radius + 50
-            label_x_base = int(center[0] + label_radius * math.cos(angle_rad))
-            label_y_base = int(center[1] - label_radius * math.sin(angle_rad))
+            label_x_base = int(center[0] + label_radius * _COMPASS_COS.item(angle_idx))
+            label_y_base = int(center[1] - label_radius * _COMPASS_SIN.item(angle_idx))
             
             for i, item in enumerate(stack):
                 # Calculate label position (stacked vertically)
                 label_y = label_y_base + (i * label_spacing)
                 
-                # Format distance
-                distance_m = item['distance_m']
-                if distance_m > 0:
-                    if distance_m < 1000:
-                        distance_text = f"~{int(distance_m)}m"
-                    else:
-                        distance_text = f"~{distance_m/1000:.1f}km"
-                else:
-                    distance_text = ""
-                
                 # Create label text with SSID and distance
-                label_text = f"{item['ssid']}"
-                if distance_text:
-                    label_text += f" {distance_text}"
+                label_text = _compass_label_text(item['ssid'], item['distance_m'])
                 
                 # Measure text size for background
-                text_size = cv2.getTextSize(label_text, cv2.FONT_HERSHEY_SIMPLEX, 0.35, 1)[0]
+                text_size = _measure_text(label_text, 0.35, 1)
                 text_width, text_height = text_size
                 
                 # Adjust label position based on which side of compass
@@ -598,45 +1096,49 @@ def _draw_compass(frame, heading, wifi_directions, rf_devices=None, center=(100,
                 bg_x2 = text_x + text_width + bg_padding
                 bg_y2 = label_y + bg_padding
                 
-                overlay = frame.copy()
-                cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), (0, 0, 0), -1)
-                cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+                # Labels stacked entirely off the frame only keep their leader line
+                visible = bg_x2 >= 0 and bg_y2 >= 0 and bg_x1 < frame_width and bg_y1 < frame_height
+                if visible:
+                    label_backgrounds.append(((bg_x1, bg_y1), (bg_x2, bg_y2)))
                 
-                # Draw leader line from label to compass ring position (in device's unique color)
+                # Leader line from label to compass ring position (in device's unique color)
+                leader = None
                 if len(stack) > 1:
-                    item_angle_rad = math.radians(-item['direction_deg'] + 90)
-                    x_ring = int(center[0] + (radius - 5) * math.cos(item_angle_rad))
-                    y_ring = int(center[1] - (radius - 5) * math.sin(item_angle_rad))
-                    cv2.line(frame, (text_x, label_y - text_height // 2), 
-                            (x_ring, y_ring), item['device_color'], 1)
+                    leader = ((text_x, label_y - text_height // 2), item['ring_point'])
                 
-                # Draw label text with outline
-                cv2.putText(frame, label_text, (text_x, label_y), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 0, 0), 2)
-                cv2.putText(frame, label_text, (text_x, label_y), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.35, item['device_color'], 1)
+                labels.append((label_text if visible else None, (text_x, label_y), item['device_color'], leader))
+        
+        darken_rects(frame, label_backgrounds)
+        
+        for label_text, origin, color, leader in labels:
+            if leader is not None:
+                cv2.line(frame, leader[0], leader[1], color, 1)
+            
+            # Draw label text with outline
+            if label_text is not None:
+                _draw_outlined_text(frame, label_text, origin, 0.35, color)
 
 
-def _render_wifi_networks(frame, state_snapshot):
+def _render_wifi_networks(frame, wifi_networks, layout):
     """
     Renders enhanced Wi-Fi network list on the right side with device type icons,
     colors, distance estimates, and rotation logic.
     
     Args:
         frame: OpenCV frame to draw on
-        state_snapshot: Complete state snapshot containing Wi-Fi networks
+        wifi_networks: List of RFDevice from the latest scan
+        layout: Layout positions from _get_layout
     """
     global _wifi_rotation_index
     
-    wifi_networks = state_snapshot.get('wifi_networks', [])
     
     if not wifi_networks:
         # Display "No Wi-Fi data" message
         draw_text(frame, "Wi-Fi: N/A", (950, 50), NEON_BLUE)
         return
     
-    # Rotation logic: show up to 8 networks at a time
-    max_display = 8
+    # Rotation logic: show up to WIFI_MAX_DISPLAY networks at a time
+    max_display = WIFI_MAX_DISPLAY
     
     with _wifi_rotation_lock:
         # Rotate through networks if there are more than max_display
@@ -649,25 +1151,55 @@ def _render_wifi_networks(frame, state_snapshot):
         else:
             display_networks = wifi_networks[:max_display]
     
-    # Render networks with enhanced display
-    frame_height, frame_width = frame.shape[:2]
-    list_x = frame_width - 350  # Position from right edge
-    list_y = 100
-    entry_height = 70  # Height per device entry
+    # The list only changes on a new scan or a rotation tick, so reuse the
+    # drawn entries until one of the displayed fields changes
+    key = (frame.shape, layout['list_x'], tuple(
+        (device.ssid, device.signal, device.signal_dbm, device.channel,
+         device.device_type, device.distance_m, device.color)
+        for device in display_networks
+    ))
+    draw_cached_layer(
+        frame, "wifi_list", key,
+        lambda canvas: _draw_wifi_entries(canvas, display_networks, layout['list_x']),
+        layout['wifi_list_bounds']
+    )
+
+
+def _draw_wifi_entries(frame, display_networks, list_x):
+    """
+    Draw the Wi-Fi list entries: accent bar, device icon, SSID, channel and signal bar.
+    
+    Args:
+        frame: OpenCV frame to draw on
+        display_networks: RFDevice entries to draw, at most WIFI_MAX_DISPLAY
+        list_x: Left edge of the list from _get_layout
+    """
+    entry_height = _WIFI_ENTRY_HEIGHT  # Height per device entry
     icon_size = 24
     
+    # Signal bar geometry
+    bar_width = 100
+    bar_height = 8
+    
+    # Lay out every entry's signal bar in one batch
+    entry_ys = _WIFI_ENTRY_YS
+    signal_dbms = np.array([device.signal_dbm for device in display_networks], dtype=np.float64)
+    # Signal strength percentage (assuming -100 dBm to -30 dBm range, 0 = unknown)
+    signal_percents = np.where(signal_dbms != 0, np.clip((signal_dbms + 100) / 70 * 100, 0, 100), 0)
+    fill_widths = (bar_width * (signal_percents / 100)).astype(np.int32).tolist()
+    bar_colors = [_SIGNAL_BAR_COLORS[p] for p in np.ceil(signal_percents).astype(np.intp).tolist()]
+    
     for i, device in enumerate(display_networks):
-        # Get device properties (handle both uppercase and lowercase keys for compatibility)
-        ssid = device.get('SSID') or device.get('ssid', 'Unknown')
-        signal = device.get('Signal') or device.get('signal', 'N/A')
-        signal_dbm = device.get('signal_dbm', 0)
-        channel = device.get('Channel') or device.get('channel', 'N/A')
-        device_type = device.get('device_type', 'unknown')
-        distance_m = device.get('distance_m', 0)
-        device_color = device.get('color', NEON_BLUE)
-        
-        # Calculate entry position
-        entry_y = list_y + (i * entry_height)
+        # Get device properties
+        ssid = device.ssid or 'Unknown'
+        signal = device.signal
+        signal_dbm = device.signal_dbm
+        channel = device.channel
+        device_type = device.device_type
+        distance_m = device.distance_m
+        device_color = device.color
+        
+        entry_y = entry_ys[i]
         
         # Draw colored accent bar on left edge (device's unique color)
         accent_bar_width = 4
@@ -697,29 +1229,15 @@ def _render_wifi_networks(frame, state_snapshot):
         ssid_with_distance = f"{ssid_display}{distance_text}"
         
         # Draw SSID text with outline for visibility
-        cv2.putText(frame, ssid_with_distance, (ssid_x, ssid_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 3)
-        cv2.putText(frame, ssid_with_distance, (ssid_x, ssid_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, device_color, 1)
+        _draw_outlined_text(frame, ssid_with_distance, (ssid_x, ssid_y), 0.5, device_color, 3)
         
         # Draw channel number below SSID in smaller text
         channel_y = entry_y + 28
         channel_text = f"Ch: {channel}"
-        cv2.putText(frame, channel_text, (ssid_x, channel_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 0, 0), 2)
-        cv2.putText(frame, channel_text, (ssid_x, channel_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, NEON_BLUE, 1)
+        _draw_outlined_text(frame, channel_text, (ssid_x, channel_y), 0.35, NEON_BLUE)
         
         # Draw signal strength bar and dBm value
         signal_y = entry_y + 45
-        bar_width = 100
-        bar_height = 8
-        
-        # Calculate signal strength percentage (assuming -100 dBm to -30 dBm range)
-        if signal_dbm != 0:
-            signal_percent = max(0, min(100, ((signal_dbm + 100) / 70) * 100))
-        else:
-            signal_percent = 0
         
         # Draw signal bar background
         cv2.rectangle(frame, (ssid_x, signal_y), 
@@ -727,17 +1245,9 @@ def _render_wifi_networks(frame, state_snapshot):
                      (50, 50, 50), -1)
         
         # Draw signal bar fill (color based on strength)
-        fill_width = int(bar_width * (signal_percent / 100))
-        if signal_percent > 66:
-            bar_color = NEON_GREEN
-        elif signal_percent > 33:
-            bar_color = NEON_ORANGE
-        else:
-            bar_color = NEON_PINK
-        
         cv2.rectangle(frame, (ssid_x, signal_y), 
-                     (ssid_x + fill_width, signal_y + bar_height), 
-                     bar_color, -1)
+                     (ssid_x + fill_widths[i], signal_y + bar_height), 
+                     bar_colors[i], -1)
         
         # Draw signal bar outline
         cv2.rectangle(frame, (ssid_x, signal_y), 
@@ -748,10 +1258,7 @@ def _render_wifi_networks(frame, state_snapshot):
         dbm_text = signal if isinstance(signal, str) else f"{signal_dbm} dBm"
         dbm_x = ssid_x + bar_width + 10
         dbm_y = signal_y + bar_height
-        cv2.putText(frame, dbm_text, (dbm_x, dbm_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, (0, 0, 0), 2)
-        cv2.putText(frame, dbm_text, (dbm_x, dbm_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, NEON_GREEN, 1)
+        _draw_outlined_text(frame, dbm_text, (dbm_x, dbm_y), 0.35, NEON_GREEN)
 
 
 def rotate_wifi_display():
@@ -764,44 +1271,180 @@ def rotate_wifi_display():
         _wifi_rotation_index += 1
 
 
-def _render_audio_visualizer(frame, audio_buffer):
+def _get_fft_window(length):
     """
-    Renders circular FFT-based audio visualizer at the center of the frame.
+    Return the cached float32 Hann window for a block length.
     
-    Args:
-        frame: OpenCV frame to draw on
-        audio_buffer: Numpy array of audio samples, or None
+    The window also carries the 1/32768 int16 scale, so windowing and the
+    conversion to float are a single multiply.
     """
-    if audio_buffer is None or len(audio_buffer) == 0:
-        return
+    window = _fft_windows.get(length)
+    if window is None:
+        window = (np.hanning(length) * (1.0 / 32768.0)).astype(np.float32)
+        _fft_windows[length] = window
+    return window
+
+
+def _aligned_empty(n, dtype, alignment=32):
+    """
+    Allocate an uninitialized 1-D array whose data starts on an aligned address.
     
-    # Number of frequency bars to display
-    NUM_BARS = 60
+    Over-allocates raw bytes and slices from the first aligned offset, the same
+    trick pyfftw.empty_aligned uses, so SIMD FFT kernels get aligned loads.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.empty(n * itemsize + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + n * itemsize].view(dtype)
+
+
+def _get_fft_plan(n):
+    """Return the FFTW plan for an n-point real FFT, creating it on first use."""
+    plan = _fft_plans.get(n)
+    if plan is None:
+        in_buf = pyfftw.empty_aligned(n, dtype='float32')
+        out_buf = pyfftw.empty_aligned(n // 2 + 1, dtype='complex64')
+        plan = pyfftw.FFTW(in_buf, out_buf, flags=('FFTW_MEASURE',), threads=1)
+        _fft_plans[n] = plan
+    return plan
+
+
+def _get_fft_input():
+    """
+    Return the persistent AUDIO_FFT_WINDOW-point float32 FFT input buffer.
     
-    # Compute FFT
-    try:
-        fft = np.abs(np.fft.rfft(audio_buffer))[:NUM_BARS]
-        # Normalize
-        if np.max(fft) > 0:
-            fft /= np.max(fft)
-    except Exception:
-        return  # Skip rendering if FFT fails
+    With pyfftw this is the plan's own input array, so windowed samples are
+    written straight into it; otherwise it is a 32-byte-aligned buffer.
+    """
+    n = AUDIO_FFT_WINDOW
+    if pyfftw is not None:
+        return _get_fft_plan(n).input_array
+    buf = _fft_inputs.get(n)
+    if buf is None:
+        buf = _aligned_empty(n, np.float32)
+        _fft_inputs[n] = buf
+    return buf
+
+
+def _window_samples(audio_buffer):
+    """
+    Window int16 PCM samples into the persistent FFT input buffer.
+    
+    Applies the Hann window and int16 scale in one multiply written into the
+    aligned buffer, and zero-pads blocks shorter than AUDIO_FFT_WINDOW.
     
-    # Draw radial bars
-    angle_step = 360 / NUM_BARS
-    for i, amplitude in enumerate(fft):
-        length = int(amplitude * 100)  # Scale bar length
-        angle = math.radians(i * angle_step)
+    Args:
+        audio_buffer: 1-D int16 array of at most AUDIO_FFT_WINDOW samples
         
-        # Starting point on circle circumference
-        x1 = int(CENTER[0] + RADIUS * np.cos(angle))
-        y1 = int(CENTER[1] + RADIUS * np.sin(angle))
+    Returns:
+        The FFT input buffer, valid until the next call
+    """
+    samples = _get_fft_input()
+    m = len(audio_buffer)
+    np.multiply(audio_buffer, _get_fft_window(m), out=samples[:m])
+    samples[m:] = 0
+    return samples
+
+
+def _fft_magnitudes(samples):
+    """
+    Compute the magnitudes of the first NUM_BARS real-FFT bins.
+    
+    Uses a pre-planned FFTW transform on aligned buffers when pyfftw is
+    available (created on first use), otherwise scipy.fft when available,
+    otherwise numpy.fft.
+    
+    Args:
+        samples: 1-D float32 array of AUDIO_FFT_WINDOW windowed samples,
+                 normally the buffer returned by _window_samples(); its
+                 contents may be overwritten by the transform
         
-        # Ending point extended outward
-        x2 = int(CENTER[0] + (RADIUS + length) * np.cos(angle))
-        y2 = int(CENTER[1] + (RADIUS + length) * np.sin(angle))
+    Returns:
+        Numpy array of NUM_BARS magnitudes; with pyfftw this is a reused
+        scratch buffer, valid until the next call
+    """
+    n = AUDIO_FFT_WINDOW
+    if pyfftw is None:
+        if scipy_fft is not None:
+            # The input buffer is rewritten for every block, so pocketfft may
+            # use it as its work area instead of copying it first
+            return np.abs(scipy_fft.rfft(samples, n=n, workers=1, overwrite_x=True)[:NUM_BARS])
+        return np.abs(np.fft.rfft(samples, n=n)[:NUM_BARS])
+    
+    plan = _get_fft_plan(n)
+    if samples is not plan.input_array:
+        plan.input_array[:] = samples
+    spectrum = plan()[:NUM_BARS]
+    return np.abs(spectrum, out=_fft_bars[:len(spectrum)])
+
+
+def _compute_visualizer_segments(audio_buffer):
+    """
+    Compute the radial bar segments for an audio buffer.
+    
+    Args:
+        audio_buffer: Numpy array of int16 PCM audio samples
         
-        cv2.line(frame, (x1, y1), (x2, y2), NEON_PINK, 2)
+    Returns:
+        int32 array of shape (n, 2, 2) for cv2.polylines, or None if nothing
+        should be drawn (silence or FFT failure)
+    """
+    # Only analyze the most recent window of the capture block
+    audio_buffer = audio_buffer[-AUDIO_FFT_WINDOW:]
+    
+    # Skip the FFT and drawing entirely for silent input (muted mic, pauses)
+    peak = max(float(audio_buffer.max()), -float(audio_buffer.min()))
+    if peak < AUDIO_SILENCE_PEAK:
+        return None
+    
+    # Compute FFT on the block windowed straight into the aligned input buffer
+    try:
+        fft = _fft_magnitudes(_window_samples(audio_buffer))
+        # Normalize in place with a single reduction; the epsilon keeps an
+        # all-zero spectrum at zero without a branch
+        fft *= 1.0 / (fft.max() + 1e-12)
+    except Exception:
+        return None  # Skip rendering if FFT fails
+    
+    # Compute all segment endpoints at once
+    n = len(fft)
+    cos_a = _BAR_COS[:n]
+    sin_a = _BAR_SIN[:n]
+    lengths = (fft * 100).astype(np.int32)  # Scale bar length
+    
+    # Starting points on circle circumference, ending points extended outward
+    x1 = _BAR_X1[:n]
+    y1 = _BAR_Y1[:n]
+    x2 = CENTER[0] + (RADIUS + lengths) * cos_a
+    y2 = CENTER[1] + (RADIUS + lengths) * sin_a
+    
+    return np.stack([np.stack([x1, y1], 1), np.stack([x2, y2], 1)], 1).astype(np.int32)
+
+
+def _render_audio_visualizer(frame, audio_buffer, audio_seq=None):
+    """
+    Renders circular FFT-based audio visualizer at the center of the frame.
+    
+    Args:
+        frame: OpenCV frame to draw on
+        audio_buffer: Numpy array of int16 PCM audio samples, or None
+        audio_seq: Audio write counter from the snapshot; when it matches the
+                   previous call the cached bars are redrawn without a new FFT
+    """
+    if audio_buffer is None or len(audio_buffer) == 0:
+        return
+    
+    # Camera frames arrive faster than audio blocks, so only recompute the
+    # bars when a new block has been published
+    key = (audio_seq, len(audio_buffer))
+    if audio_seq is None or key != _visualizer_cache["key"]:
+        _visualizer_cache["key"] = key
+        _visualizer_cache["segments"] = _compute_visualizer_segments(audio_buffer)
+    
+    # Draw all radial bars with a single polylines call
+    segments = _visualizer_cache["segments"]
+    if segments is not None:
+        cv2.polylines(frame, segments, False, NEON_PINK, 2)
 
 
 def _render_rf_overlays(frame):
@@ -814,30 +1457,36 @@ def _render_rf_overlays(frame):
     x0, y0 = 50, 500
     spacing = 30
     
+    # Take the queued events under the lock, then draw them with it released
+    # so the producers never wait on text rendering
     with _rf_lock:
-        # Render signal events
-        while _signal_events:
-            label, direction, strength = _signal_events.popleft()
-            text = f"[RF] {label} {direction} {strength}dBm"
-            draw_text(frame, text, (x0, y0), NEON_GREEN)
-            y0 += spacing
-        
-        # Render scan updates
-        while _scan_updates:
-            freqs, peaks = _scan_updates.popleft()
-            text = "[Scan] " + ", ".join(
-                f"{f/1e6:.1f}MHz={'PK' if p else '--'}" 
-                for f, p in zip(freqs, peaks)
-            )
-            draw_text(frame, text, (x0, y0), (255, 255, 0))
-            y0 += spacing
-        
-        # Render messages
-        while _message_events:
-            sender, text_msg, rssi = _message_events.popleft()
-            text = f"[Msg] {sender}: {text_msg} ({rssi}dBm)"
-            draw_text(frame, text, (x0, y0), (255, 0, 255))
-            y0 += spacing
+        signal_events = list(_signal_events)
+        _signal_events.clear()
+        scan_updates = list(_scan_updates)
+        _scan_updates.clear()
+        message_events = list(_message_events)
+        _message_events.clear()
+    
+    # Render signal events
+    for label, direction, strength in signal_events:
+        text = f"[RF] {label} {direction} {strength}dBm"
+        draw_text(frame, text, (x0, y0), NEON_GREEN)
+        y0 += spacing
+    
+    # Render scan updates
+    for freqs, peaks in scan_updates:
+        text = "[Scan] " + ", ".join(
+            f"{f/1e6:.1f}MHz={'PK' if p else '--'}" 
+            for f, p in zip(freqs, peaks)
+        )
+        draw_text(frame, text, (x0, y0), (255, 255, 0))
+        y0 += spacing
+    
+    # Render messages
+    for sender, text_msg, rssi in message_events:
+        text = f"[Msg] {sender}: {text_msg} ({rssi}dBm)"
+        draw_text(frame, text, (x0, y0), (255, 0, 255))
+        y0 += spacing
 
 
 # Public API for queueing RF events (maintains compatibility with existing code)
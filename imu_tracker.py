@@ -11,6 +11,7 @@ import time
 import logging
 import math
 from typing import Optional
+from cpu_affinity import pin_current_thread, SERVICE_CORE
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +20,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Radians-to-degrees factor (same constant math.degrees uses) and the libm
+# functions used at the IMU poll rate, bound once
+_RAD2DEG = 180.0 / math.pi
+_atan2 = math.atan2
+_asin = math.asin
+
 
 def quaternion_to_euler(qw: float, qx: float, qy: float, qz: float) -> tuple:
     """
@@ -37,29 +44,19 @@ def quaternion_to_euler(qw: float, qx: float, qy: float, qz: float) -> tuple:
         - roll: -180 to 180 degrees (wing up/down)
     """
     # Roll (x-axis rotation)
-    sinr_cosp = 2 * (qw * qx + qy * qz)
-    cosr_cosp = 1 - 2 * (qx * qx + qy * qy)
-    roll = math.atan2(sinr_cosp, cosr_cosp)
+    roll = _atan2(2 * (qw * qx + qy * qz), 1 - 2 * (qx * qx + qy * qy))
     
-    # Pitch (y-axis rotation)
+    # Pitch (y-axis rotation), clamped to ±90 degrees if out of range
     sinp = 2 * (qw * qy - qz * qx)
-    if abs(sinp) >= 1:
-        pitch = math.copysign(math.pi / 2, sinp)  # Use 90 degrees if out of range
-    else:
-        pitch = math.asin(sinp)
+    pitch = _asin(1.0 if sinp > 1.0 else -1.0 if sinp < -1.0 else sinp)
     
     # Yaw/Heading (z-axis rotation)
-    siny_cosp = 2 * (qw * qz + qx * qy)
-    cosy_cosp = 1 - 2 * (qy * qy + qz * qz)
-    yaw = math.atan2(siny_cosp, cosy_cosp)
-    
-    # Convert to degrees
-    roll_deg = math.degrees(roll)
-    pitch_deg = math.degrees(pitch)
-    heading_deg = math.degrees(yaw)
+    yaw = _atan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
     
-    # Normalize heading to 0-360 range
-    heading_deg = (heading_deg + 360) % 360
+    # Convert to degrees and normalize heading to 0-360 range
+    roll_deg = roll * _RAD2DEG
+    pitch_deg = pitch * _RAD2DEG
+    heading_deg = (yaw * _RAD2DEG + 360) % 360
     
     return heading_deg, pitch_deg, roll_deg
 
@@ -112,13 +109,15 @@ def _imu_tracking_loop(shared_state, stop_event):
     Main loop for IMU tracking service thread.
     
     Continuously reads sensor data from BNO085 and writes to SharedState until
-    stop_event is set. Polls at approximately 50Hz (20ms intervals).
+    stop_event is set. Polls at 50Hz (20ms intervals) on a fixed schedule, so a
+    slow I2C read shortens the following wait instead of lowering the rate.
     
     Args:
         shared_state: SharedState instance to write IMU data to
         stop_event: threading.Event to signal thread shutdown
     """
     logger.info("[IMU] IMU tracking service started")
+    pin_current_thread(SERVICE_CORE, "IMU")
     
     # Initialize sensor
     sensor = initialize_bno085()
@@ -130,7 +129,8 @@ def _imu_tracking_loop(shared_state, stop_event):
         # Import here after successful initialization
         from adafruit_bno08x.i2c import BNO_REPORT_ROTATION_VECTOR
         
-        poll_interval = 0.02  # 20ms = ~50Hz
+        poll_interval = 0.02  # 20ms = 50Hz
+        next_poll = time.perf_counter()
         
         while not stop_event.is_set():
             try:
@@ -155,8 +155,14 @@ def _imu_tracking_loop(shared_state, stop_event):
             except Exception as e:
                 logger.error(f"[IMU] Error reading sensor data: {e}", exc_info=True)
             
-            # Sleep for poll interval (~50Hz)
-            time.sleep(poll_interval)
+            # Wait until the next 20ms deadline, waking immediately on stop_event;
+            # after an overrun, restart the schedule rather than bursting to catch up
+            next_poll += poll_interval
+            delay = next_poll - time.perf_counter()
+            if delay > 0:
+                stop_event.wait(delay)
+            else:
+                next_poll = time.perf_counter()
     
     except Exception as e:
         logger.error(f"[IMU] Fatal error in IMU tracking service: {e}", exc_info=True)
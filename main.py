@@ -1,6 +1,7 @@
 # main.py
 # Entrypoint: starts HUD and orchestrates modules
 
+import atexit
 import cv2
 import traceback
 import subprocess
@@ -8,17 +9,35 @@ import time
 import argparse
 import json
 import os
+import re
+import select
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from camera import CameraStream
 from shared_state import SharedState
 from service_manager import ServiceManager
 from hud_renderer import render_hud
-from config import get_config, validate_config
+from config import get_config_mutable, validate_config
+
+
+# Kernel's network interface directory (one entry per interface)
+SYS_CLASS_NET = "/sys/class/net"
+
+# Onboard wireless interface names (wlan0, wlp*), skipped during calibration
+_ONBOARD_WIFI_RE = re.compile(r'wlan0$|wlp')
+
+# startup.log handle, opened on the first log_startup call and closed at exit
+_startup_log = None
 
 
 def log_startup(message):
     """Log startup messages to both console and startup.log file."""
-    with open("startup.log", "a") as f:
-        f.write(message + "\n")
+    global _startup_log
+    if _startup_log is None:
+        # Line-buffered, so each message still reaches the file if startup crashes
+        _startup_log = open("startup.log", "a", buffering=1)
+        atexit.register(_startup_log.close)
+    _startup_log.write(message + "\n")
     print(message)
 
 
@@ -26,52 +45,32 @@ def get_wifi_interfaces():
     """
     Get list of wireless interfaces, filtering out onboard wireless.
     
-    Uses 'iw dev' command to list all wireless interfaces and filters out
-    common onboard wireless interface names (wlan0, wlp1s0, wlp*).
+    Reads the interface list from /sys/class/net, where wireless interfaces
+    have a 'wireless' directory, and filters out common onboard wireless
+    interface names (wlan0, wlp1s0, wlp*).
     
     Returns:
         list: List of wireless interface names (USB adapters only)
     """
     try:
-        # Execute 'iw dev' command to list wireless interfaces
-        result = subprocess.run(
-            ['iw', 'dev'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode != 0:
-            log_startup(f"Warning: 'iw dev' command failed: {result.stderr}")
-            return []
-        
-        # Parse output to extract interface names
-        interfaces = []
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if line.startswith('Interface '):
-                interface_name = line.split()[1]
-                
-                # Filter out onboard wireless interfaces
-                # Keep only USB adapters (wlan1+, wlan2+, wlx*)
-                if interface_name == 'wlan0':
-                    continue
-                if interface_name.startswith('wlp'):
-                    continue
-                
-                interfaces.append(interface_name)
-        
-        return interfaces
-        
-    except subprocess.TimeoutExpired:
-        log_startup("Warning: 'iw dev' command timed out")
-        return []
-    except FileNotFoundError:
-        log_startup("Warning: 'iw' command not found. Install iw package.")
-        return []
-    except Exception as e:
+        interface_names = sorted(os.listdir(SYS_CLASS_NET))
+    except OSError as e:
         log_startup(f"Warning: Error getting Wi-Fi interfaces: {e}")
         return []
+    
+    interfaces = []
+    for interface_name in interface_names:
+        if not os.path.isdir(os.path.join(SYS_CLASS_NET, interface_name, 'wireless')):
+            continue
+        
+        # Filter out onboard wireless interfaces
+        # Keep only USB adapters (wlan1+, wlan2+, wlx*)
+        if _ONBOARD_WIFI_RE.match(interface_name):
+            continue
+        
+        interfaces.append(interface_name)
+    
+    return interfaces
 
 
 def find_new_interface(old_list, new_list):
@@ -85,14 +84,195 @@ def find_new_interface(old_list, new_list):
     Returns:
         str or None: The newly detected interface name, or None if no new interface found
     """
-    for interface in new_list:
-        if interface not in old_list:
-            return interface
-    return None
+    old_set = set(old_list)
+    return next((interface for interface in new_list if interface not in old_set), None)
+
+
+# How long calibration waits for a newly connected adapter to enumerate
+ENUMERATION_TIMEOUT = 5.0
+
+# Once a new adapter appears, how long the links must stay quiet before its name
+# is trusted (udev renames follow within milliseconds), and the most time spent
+# waiting for that
+INTERFACE_SETTLE_TIME = 0.3
+INTERFACE_SETTLE_LIMIT = 2.0
+
+
+def open_link_monitor():
+    """
+    Start an 'ip monitor link' subprocess that reports network link changes.
+    
+    Opened once for the whole calibration, so adapters that enumerate while the
+    user is still at a prompt are reported as soon as the wait starts.
+    
+    Returns:
+        subprocess.Popen or None: The running monitor, or None if 'ip' is unavailable
+    """
+    try:
+        return subprocess.Popen(
+            ['ip', '-o', 'monitor', 'link'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    except OSError as e:
+        log_startup(f"Warning: Could not start 'ip monitor link': {e}")
+        return None
+
+
+def close_link_monitor(monitor):
+    """Stop a monitor started by open_link_monitor (None or already closed is ignored)."""
+    if monitor is None or monitor.stdout.closed:
+        return
+    monitor.terminate()
+    try:
+        monitor.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        monitor.kill()
+        monitor.wait()
+    monitor.stdout.close()
+
+
+def _read_link_events(monitor, timeout):
+    """
+    Wait up to timeout seconds for link events from the monitor and drain them.
+    
+    The event text isn't parsed; callers only need to know that a link changed
+    and then re-read the interface list.
+    
+    Returns:
+        bool or None: True if events were read, False on timeout, None if the
+        monitor has exited (or was closed)
+    """
+    if monitor.stdout.closed:
+        return None
+    if timeout <= 0:
+        return False
+    fd = monitor.stdout.fileno()
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return False
+    return True if os.read(fd, 4096) else None
+
+
+def _settle_interfaces(monitor, current_interfaces, poll):
+    """
+    Wait for link changes to stop, then return the final interface list.
+    
+    udev may rename a new adapter (wlan1 -> wlx<mac>) just after it appears, so
+    the list is only trusted once no link event (or, without a monitor, no list
+    change) has been seen for INTERFACE_SETTLE_TIME, up to INTERFACE_SETTLE_LIMIT.
+    
+    Args:
+        monitor: Popen from open_link_monitor, or None
+        current_interfaces: Interface list read when the new adapter was found
+        poll: Seconds between checks when there is no monitor
+        
+    Returns:
+        list: Interface list after the links settled
+    """
+    settle_deadline = time.monotonic() + INTERFACE_SETTLE_LIMIT
+    if monitor is not None:
+        while True:
+            events = _read_link_events(monitor, min(INTERFACE_SETTLE_TIME, settle_deadline - time.monotonic()))
+            if events is None:
+                # The monitor exited: close it and poll for the rest of the settle time
+                close_link_monitor(monitor)
+                current_interfaces = get_wifi_interfaces()
+                break
+            if not events:
+                return get_wifi_interfaces()
+    
+    stable_since = time.monotonic()
+    while time.monotonic() < settle_deadline:
+        time.sleep(poll)
+        latest_interfaces = get_wifi_interfaces()
+        if latest_interfaces != current_interfaces:
+            current_interfaces = latest_interfaces
+            stable_since = time.monotonic()
+        elif time.monotonic() - stable_since >= INTERFACE_SETTLE_TIME:
+            break
+    return current_interfaces
+
+
+def wait_for_new_interface(known, monitor, timeout=ENUMERATION_TIMEOUT, poll=0.1):
+    """
+    Wait for a wireless interface that is not in known to appear.
+    
+    The interface list is re-read only when the link monitor reports a change,
+    so this returns as soon as the adapter enumerates instead of after a fixed
+    delay. Without a monitor (or once it exits), the list is polled every poll
+    seconds instead.
+    Once a new interface shows up, the links are given time to settle so a
+    udev rename is reported under its final name.
+    
+    Args:
+        known: List of interface names already accounted for
+        monitor: Popen from open_link_monitor, or None
+        timeout: Maximum seconds to wait for the new interface
+        poll: Seconds between checks when there is no monitor
+        
+    Returns:
+        tuple: (new interface name or None, latest list of interfaces)
+    """
+    deadline = time.monotonic() + timeout
+    current_interfaces = get_wifi_interfaces()
+    while find_new_interface(known, current_interfaces) is None:
+        events = None if monitor is None else _read_link_events(monitor, deadline - time.monotonic())
+        if events is None:
+            if monitor is not None:
+                # The monitor exited: close it and poll until the deadline
+                close_link_monitor(monitor)
+                monitor = None
+            if time.monotonic() >= deadline:
+                return None, current_interfaces
+            time.sleep(poll)
+        elif not events:
+            return None, current_interfaces  # Timed out
+        current_interfaces = get_wifi_interfaces()
+    
+    current_interfaces = _settle_interfaces(monitor, current_interfaces, poll)
+    return find_new_interface(known, current_interfaces), current_interfaces
+
+
+def _detect_adapter(side, step, known, monitor):
+    """
+    Prompt the user to connect one adapter and detect its interface.
+    
+    Args:
+        side: "RIGHT" or "LEFT"
+        step: Calibration step number shown to the user
+        known: List of interface names present before this adapter
+        monitor: Popen from open_link_monitor, or None
+        
+    Returns:
+        str or None: The adapter's interface name, or None if none was detected
+    """
+    print("\n" + "-"*50)
+    print(f"Step {step}: Connect the {side} adapter")
+    print("-"*50)
+    print(f"Connect the {side} adapter (switch ON or plug in USB)")
+    input("Press Enter when connected...")
+    
+    print("Waiting for USB enumeration...")
+    interface, current_interfaces = wait_for_new_interface(known, monitor)
+    
+    if interface:
+        print(f"✓ Detected {side} adapter: {interface}")
+    else:
+        print("✗ ERROR: No new interface detected!")
+        print(f"Current interfaces: {', '.join(current_interfaces) if current_interfaces else 'None'}")
+        print("\nTroubleshooting:")
+        print("- Make sure the adapter is powered on")
+        print("- Try unplugging and replugging the USB adapter")
+        print("- Check that the adapter is recognized by the system (lsusb)")
+    return interface
 
 
 CALIBRATION_FILE = ".wifi_calibration.json"
 
+# Last parsed calibration and the file mtime it was read at
+_calibration_cache = {"mtime": None, "config": None}
+
 
 def save_calibration(calibration_config):
     """
@@ -113,13 +293,20 @@ def load_calibration():
     """
     Load calibration configuration from temporary file.
     
+    The parsed file is cached by modification time, so repeated loads of an
+    unchanged file skip the JSON parse.
+    
     Returns:
         dict or None: Calibration config if file exists, None otherwise
     """
     try:
         if os.path.exists(CALIBRATION_FILE):
-            with open(CALIBRATION_FILE, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(CALIBRATION_FILE).st_mtime_ns
+            if _calibration_cache["mtime"] != mtime:
+                with open(CALIBRATION_FILE, 'r') as f:
+                    _calibration_cache["config"] = json.load(f)
+                _calibration_cache["mtime"] = mtime
+            return dict(_calibration_cache["config"])
     except Exception as e:
         log_startup(f"Warning: Could not load calibration: {e}")
     return None
@@ -159,53 +346,21 @@ def calibrate_wifi_adapters():
     else:
         print("No USB Wi-Fi adapters detected (good - starting fresh)")
     
-    # Detect RIGHT adapter
-    print("\n" + "-"*50)
-    print("Step 1: Connect the RIGHT adapter")
-    print("-"*50)
-    print("Connect the RIGHT adapter (switch ON or plug in USB)")
-    input("Press Enter when connected...")
-    
-    print("Waiting for USB enumeration...")
-    time.sleep(2)  # Wait for USB enumeration
-    
-    current_interfaces = get_wifi_interfaces()
-    right_interface = find_new_interface(baseline_interfaces, current_interfaces)
-    
-    if right_interface:
-        print(f"✓ Detected RIGHT adapter: {right_interface}")
-    else:
-        print("✗ ERROR: No new interface detected!")
-        print(f"Current interfaces: {', '.join(current_interfaces) if current_interfaces else 'None'}")
-        print("\nTroubleshooting:")
-        print("- Make sure the adapter is powered on")
-        print("- Try unplugging and replugging the USB adapter")
-        print("- Check that the adapter is recognized by the system (lsusb)")
-        return None
-    
-    # Detect LEFT adapter
-    print("\n" + "-"*50)
-    print("Step 2: Connect the LEFT adapter")
-    print("-"*50)
-    print("Connect the LEFT adapter (switch ON or plug in USB)")
-    input("Press Enter when connected...")
-    
-    print("Waiting for USB enumeration...")
-    time.sleep(2)  # Wait for USB enumeration
-    
-    current_interfaces = get_wifi_interfaces()
-    left_interface = find_new_interface(baseline_interfaces + [right_interface], current_interfaces)
-    
-    if left_interface:
-        print(f"✓ Detected LEFT adapter: {left_interface}")
-    else:
-        print("✗ ERROR: No new interface detected!")
-        print(f"Current interfaces: {', '.join(current_interfaces) if current_interfaces else 'None'}")
-        print("\nTroubleshooting:")
-        print("- Make sure the adapter is powered on")
-        print("- Try unplugging and replugging the USB adapter")
-        print("- Check that the adapter is recognized by the system (lsusb)")
-        return None
+    # Watch for link changes from here on, so each adapter is detected as soon
+    # as it enumerates
+    monitor = open_link_monitor()
+    try:
+        # Detect RIGHT adapter
+        right_interface = _detect_adapter("RIGHT", 1, baseline_interfaces, monitor)
+        if right_interface is None:
+            return None
+        
+        # Detect LEFT adapter
+        left_interface = _detect_adapter("LEFT", 2, baseline_interfaces + [right_interface], monitor)
+        if left_interface is None:
+            return None
+    finally:
+        close_link_monitor(monitor)
     
     # Prompt for adapter separation
     print("\n" + "-"*50)
@@ -273,8 +428,8 @@ def main():
     # Log startup message indicating HUD is starting
     log_startup("=== HUD Starting Up ===")
     
-    # Load configuration from config module
-    config = get_config()
+    # Load a mutable copy of the configuration (calibration may disable services)
+    config = get_config_mutable()
     
     # Handle Wi-Fi adapter calibration if Wi-Fi locator is enabled
     if config.get('enable_wifi_locator', False):
@@ -307,9 +462,6 @@ def main():
             
             try:
                 # Wait for user input with timeout
-                import select
-                import sys
-                
                 # Check if stdin is available (not in background/non-interactive mode)
                 if sys.stdin.isatty():
                     print("Waiting for input (30 second timeout)...")
@@ -376,7 +528,8 @@ def main():
     
     # Initialize CameraStream (no changes needed)
     log_startup("Initializing camera...")
-    cam = CameraStream()
+    # Frames are flipped 180° on the capture thread, off the render path
+    cam = CameraStream(rotation=cv2.ROTATE_180)
     
     # Initialize ServiceManager with shared_state and config
     log_startup("Initializing ServiceManager...")
@@ -391,26 +544,41 @@ def main():
     cv2.namedWindow("HUD Camera Test", cv2.WINDOW_NORMAL)
     cv2.setWindowProperty("HUD Camera Test", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
     
+    # HUD drawing runs on a single worker thread so the next frame renders
+    # while this thread displays the previous one (imshow/pollKey must stay here)
+    render_executor = ThreadPoolExecutor(max_workers=1)
+    pending_render = None
+    
     # Begin the main loop to continuously capture and process frames for HUD display
     log_startup("Entering main loop...")
     try:
         while True:
-            # Modify main loop to read frame from camera
-            frame = cam.read()
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
-            
-            if frame is not None:
+            # Only render when the camera has published a new frame; the
+            # timeout keeps the window responsive if the camera stalls
+            if cam.new_frame.wait(timeout=0.1):
+                # Modify main loop to read frame from camera; read() always
+                # returns a valid frame and hands it off (the camera thread never
+                # writes to it again), so the render worker can draw on it in place
+                frame = cam.read()
+                
                 # Modify main loop to call shared_state.get_snapshot()
                 snapshot = shared_state.get_snapshot()
                 
-                # Modify main loop to call render_hud(frame, snapshot)
-                frame = render_hud(frame, snapshot)
-                
-                # Display rendered frame (keep existing code)
-                cv2.imshow("HUD Camera Test", frame)
+                # Start rendering this frame, then show the one rendered last time
+                next_render = render_executor.submit(render_hud, frame, snapshot)
+                if pending_render is not None:
+                    cv2.imshow("HUD Camera Test", pending_render.result())
+                pending_render = next_render
+            elif pending_render is not None and pending_render.done():
+                # The camera stalled: show the last rendered frame instead of
+                # holding it until the next capture
+                cv2.imshow("HUD Camera Test", pending_render.result())
+                pending_render = None
             
-            # Check for quit key
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            # Check for quit key; pollKey pumps the window events (so the frame
+            # shown above is painted) without waitKey's minimum 1 ms sleep, since
+            # the new_frame wait above already paces the loop
+            if cv2.pollKey() & 0xFF == ord('q'):
                 print("Quitting camera test.")
                 break
                 
@@ -418,6 +586,9 @@ def main():
         # Cleanup: stop all services, camera stream, and close display windows
         log_startup("Shutting down...")
         
+        # Let an in-flight render finish before tearing anything down
+        render_executor.shutdown(wait=True)
+        
         # On shutdown, call service_manager.stop_all()
         service_manager.stop_all()
         
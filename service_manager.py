@@ -170,7 +170,11 @@ class ServiceManager:
         # Audio Service
         if self.config.get("enable_audio", False):
             stop_event = threading.Event()
-            start_audio_service(self.shared_state, stop_event)
+            start_audio_service(
+                self.shared_state,
+                stop_event,
+                passthrough_gain=self.config.get("audio_passthrough_gain", 1.0)
+            )
             self.services.append(("Audio", stop_event, None))
             logger.info("Service 'Audio' started")
         else:
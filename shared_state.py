@@ -3,13 +3,17 @@ SharedState - Thread-safe centralized data store for HUD variables.
 
 This module provides a thread-safe storage mechanism for all HUD data including
 GPS, IMU, system metrics, Wi-Fi scan results, Wi-Fi direction estimates, and audio buffers.
-All read and write operations are protected by threading locks to prevent race conditions.
+All read and write operations are protected by threading locks to prevent race conditions,
+except the audio buffer, which is handed off through a lock-free single-producer ring so
+the realtime audio callback never blocks on the renderer.
 """
 
 import threading
 from typing import Optional, List, Dict, Any
 import numpy as np
 
+AUDIO_RING_SLOTS = 4  # Power of two so the slot index wraps with a mask
+
 
 class SharedState:
     """Thread-safe centralized storage for all HUD data."""
@@ -51,8 +55,12 @@ class SharedState:
         # Wi-Fi direction estimates (dict keyed by SSID)
         self._wifi_directions = {}
         
-        # Audio buffer
-        self._audio_buffer = None
+        # Audio buffer ring: the producer fills slot (seq % AUDIO_RING_SLOTS), then
+        # publishes by incrementing the write counter; readers copy the slot of the
+        # latest write and use the counter to detect being lapped (a seqlock).
+        # Slots are allocated on first write (and reallocated if the length changes).
+        self._audio_slots = None
+        self._audio_seq = 0  # Buffers written since (re)allocation; 0 means none
     
     # GPS data methods
     def set_gps_data(self, latitude: Optional[float] = None, 
@@ -209,23 +217,61 @@ class SharedState:
     # Audio buffer methods
     def set_audio_buffer(self, buffer: Optional[np.ndarray]):
         """
-        Thread-safe write of audio buffer.
+        Lock-free write of audio buffer.
+        
+        Must only be called from a single producer (the audio callback). The
+        samples are copied into the next ring slot and then published with a
+        single store of the write counter, so readers never see a partially
+        written buffer.
         
         Args:
             buffer: Numpy array containing audio samples
         """
-        with self._lock:
-            self._audio_buffer = buffer.copy() if buffer is not None else None
+        if buffer is None:
+            self._audio_slots = None
+            self._audio_seq = 0
+            return
+        
+        slots = self._audio_slots
+        if slots is None or slots[0].shape != buffer.shape or slots[0].dtype != buffer.dtype:
+            slots = [np.empty_like(buffer) for _ in range(AUDIO_RING_SLOTS)]
+            self._audio_seq = 0
+            self._audio_slots = slots
+        
+        seq = self._audio_seq
+        np.copyto(slots[seq & (AUDIO_RING_SLOTS - 1)], buffer)
+        self._audio_seq = seq + 1
+    
+    def _read_audio_slot(self) -> Optional[np.ndarray]:
+        """Copy the most recently published audio slot, or return None."""
+        while True:
+            slots = self._audio_slots
+            seq = self._audio_seq
+            if slots is None or seq == 0:
+                return None
+            data = slots[(seq - 1) & (AUDIO_RING_SLOTS - 1)].copy()
+            # Retry if the producer wrapped around onto our slot mid-copy
+            if self._audio_seq - seq < AUDIO_RING_SLOTS - 1:
+                return data
     
     def get_audio_buffer(self) -> Optional[np.ndarray]:
         """
-        Thread-safe read of audio buffer.
+        Lock-free read of audio buffer.
         
         Returns:
             Numpy array containing audio samples, or None
         """
-        with self._lock:
-            return self._audio_buffer.copy() if self._audio_buffer is not None else None
+        return self._read_audio_slot()
+    
+    def get_audio_sequence(self) -> int:
+        """
+        Lock-free read of the audio write counter.
+        
+        Returns:
+            Number of audio buffers published (resets if the buffer length changes),
+            useful for telling whether new audio has arrived since a previous read
+        """
+        return self._audio_seq
     
     # Complete snapshot method
     def get_snapshot(self) -> Dict[str, Any]:
@@ -243,7 +289,11 @@ class SharedState:
                 - wifi_networks: List of Wi-Fi networks
                 - wifi_directions: Dict of Wi-Fi direction estimates
                 - audio_buffer: Audio buffer numpy array or None
+                - audio_seq: Audio write counter (see get_audio_sequence)
         """
+        # Read the audio counter before the audio buffer, so a counter that
+        # changes mid-snapshot can only be older than the buffer returned
+        audio_seq = self._audio_seq
         with self._lock:
             return {
                 "gps": self._gps_data.copy(),
@@ -252,5 +302,6 @@ class SharedState:
                 "wifi_networks": self._wifi_networks.copy(),
                 "wifi_networks_by_interface": {k: v.copy() for k, v in self._wifi_networks_by_interface.items()},
                 "wifi_directions": self._wifi_directions.copy(),
-                "audio_buffer": self._audio_buffer.copy() if self._audio_buffer is not None else None
+                "audio_buffer": self._read_audio_slot(),
+                "audio_seq": audio_seq
             }
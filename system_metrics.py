@@ -9,7 +9,8 @@ import threading
 import time
 import logging
 import psutil
-from typing import Union
+from cpu_affinity import pin_current_thread, SERVICE_CORE
+from typing import Optional, Union
 
 
 # Configure logging
@@ -20,44 +21,83 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def read_cpu_temp() -> Union[float, str]:
-    """
-    Read CPU temperature using platform-agnostic methods with fallback.
-    
-    Tries multiple methods in order:
-    1. Linux thermal zone file (/sys/class/thermal/thermal_zone0/temp)
-    2. psutil.sensors_temperatures() if available
-    3. Returns "N/A" if all methods fail
-    
-    Returns:
-        CPU temperature in degrees Celsius, or "N/A" if unavailable
-    """
-    # Try Linux thermal zone file
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+# Temperature source state, remembered between reads so each poll goes
+# straight to the source that worked last time
+_thermal_file = None             # Open thermal zone file, re-read with seek(0)
+_thermal_zone_available = True   # Cleared once the thermal zone is known to be missing
+_psutil_sensor_name = None       # psutil sensor that last provided a reading
+
+
+def _read_thermal_zone() -> Optional[float]:
+    """Read the Linux thermal zone, keeping the sysfs file open between reads."""
+    global _thermal_file, _thermal_zone_available
+    if not _thermal_zone_available:
+        return None
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            millideg = int(f.read().strip())
-            return millideg / 1000.0  # Convert millidegrees to Celsius
-    except (FileNotFoundError, PermissionError, ValueError):
-        pass
-    
-    # Try psutil sensors_temperatures (if available on platform)
+        if _thermal_file is None:
+            _thermal_file = open(THERMAL_ZONE_PATH, "r")
+        _thermal_file.seek(0)
+        millideg = int(_thermal_file.read().strip())
+        return millideg / 1000.0  # Convert millidegrees to Celsius
+    except (FileNotFoundError, PermissionError):
+        _thermal_zone_available = False
+    except (OSError, ValueError):
+        # Transient read failure; reopen on the next call
+        if _thermal_file is not None:
+            _thermal_file.close()
+        _thermal_file = None
+    return None
+
+
+def _read_psutil_temp() -> Optional[float]:
+    """Read CPU temperature from psutil, preferring the sensor that worked last."""
+    global _psutil_sensor_name
     try:
         if hasattr(psutil, "sensors_temperatures"):
             temps = psutil.sensors_temperatures()
             if temps:
+                # Reuse the sensor found on a previous read
+                if _psutil_sensor_name and temps.get(_psutil_sensor_name):
+                    return temps[_psutil_sensor_name][0].current
                 # Try to find CPU temperature from common sensor names
                 for name in ["coretemp", "cpu_thermal", "cpu-thermal"]:
                     if name in temps and temps[name]:
+                        _psutil_sensor_name = name
                         return temps[name][0].current
                 # If no known sensor name, use first available
-                first_sensor = next(iter(temps.values()))
+                name, first_sensor = next(iter(temps.items()))
                 if first_sensor:
+                    _psutil_sensor_name = name
                     return first_sensor[0].current
     except Exception:
         pass
+    return None
+
+
+def read_cpu_temp() -> Union[float, str]:
+    """
+    Read CPU temperature using platform-agnostic methods with fallback.
+    
+    Tries multiple methods in order:
+    1. Linux thermal zone file (/sys/class/thermal/thermal_zone0/temp)
+    2. psutil.sensors_temperatures() if available
+    3. Returns "N/A" if all methods fail
+    
+    The thermal zone file is kept open and skipped once known to be missing,
+    and the psutil sensor that worked is remembered, so steady-state polls
+    avoid repeated failed opens and sensor searches.
+    
+    Returns:
+        CPU temperature in degrees Celsius, or "N/A" if unavailable
+    """
+    temp = _read_thermal_zone()
+    if temp is None:
+        temp = _read_psutil_temp()
     
     # All methods failed
-    return "N/A"
+    return temp if temp is not None else "N/A"
 
 
 def collect_system_metrics() -> dict:
@@ -103,6 +143,7 @@ def _metrics_collection_loop(shared_state, stop_event):
         stop_event: threading.Event to signal thread shutdown
     """
     logger.info("System metrics collection service started")
+    pin_current_thread(SERVICE_CORE, "system metrics")
     
     try:
         while not stop_event.is_set():
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+GPS Tracker Tests
+-----------------
+Tests the gpsd JSON reader against a fake gpsd on a local TCP socket: reports
+split across recv() chunks, CRLF line endings, non-TPV and malformed lines,
+and a gpsd restart that the tracker must reconnect after.
+"""
+
+import socket
+import sys
+import threading
+import time
+
+import gps_tracker
+from shared_state import SharedState
+
+
+def wait_for(condition, timeout=3.0):
+    """Poll condition() until it is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class FakeGpsd:
+    """Accepts tracker connections on an ephemeral port and records what it received."""
+
+    def __init__(self):
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.server.settimeout(3.0)
+        self.address = self.server.getsockname()
+        self.watch_commands = []
+
+    def accept(self):
+        conn, _ = self.server.accept()
+        conn.settimeout(3.0)
+        self.watch_commands.append(conn.recv(4096))
+        return conn
+
+    def close(self):
+        self.server.close()
+
+
+def test_gpsd_stream_parsing_and_reconnect():
+    """Test TPV parsing across chunk boundaries and reconnecting after gpsd closes."""
+    print("\n=== Test: gpsd Stream Parsing and Reconnect ===")
+
+    gpsd = FakeGpsd()
+    shared_state = SharedState()
+    stop_event = threading.Event()
+    first_seen = threading.Event()
+    errors = []
+
+    def serve():
+        try:
+            # First session: a report split mid-number across two sends, CRLF
+            # endings, and lines the tracker must skip
+            conn = gpsd.accept()
+            conn.sendall(b'{"class":"VERSION","release":"3.25"}\r\n{"class":"TPV","lat":37.')
+            time.sleep(0.05)
+            conn.sendall(b'7749,"lon":-122.4194,"speed":5.5,"track":45.0}\r\n'
+                         b'not json\r\n'
+                         b'{"class":"SKY","lat":0.0,"lon":0.0}\n'
+                         b'{"class":"TPV","lat":1.0')  # Truncated by the disconnect
+            first_seen.wait(3.0)
+            conn.close()
+
+            # Second session after gpsd "restarts"
+            conn = gpsd.accept()
+            conn.sendall(b'{"class":"TPV","lat":40.0,"lon":-74.0,"speed":1.0,"track":90.0}\n')
+            conn.recv(4096)  # Returns once the tracker disconnects
+            conn.close()
+        except Exception as e:
+            errors.append(e)
+
+    server_thread = threading.Thread(target=serve, daemon=True)
+    server_thread.start()
+
+    original = gps_tracker.GPSD_ADDRESS
+    gps_tracker.GPSD_ADDRESS = gpsd.address
+    try:
+        thread = gps_tracker.start_gps_tracker_service(shared_state, stop_event)
+
+        assert wait_for(lambda: shared_state.get_gps_data()['latitude'] == 37.7749), \
+            f"First TPV report not parsed: {shared_state.get_gps_data()}"
+        gps_data = shared_state.get_gps_data()
+        assert gps_data['longitude'] == -122.4194, "GPS longitude mismatch"
+        assert gps_data['speed'] == 5.5, "GPS speed mismatch"
+        assert gps_data['heading'] == 45.0, "GPS heading mismatch"
+        print("✓ Parsed a TPV report split across recv() chunks with CRLF endings")
+
+        # Give the SKY and malformed lines time to be (not) applied
+        time.sleep(0.1)
+        assert shared_state.get_gps_data()['latitude'] == 37.7749, "Non-TPV report overwrote GPS data"
+        print("✓ Skipped non-TPV and malformed lines")
+        first_seen.set()
+
+        assert wait_for(lambda: shared_state.get_gps_data()['latitude'] == 40.0), \
+            f"No report after reconnecting: {shared_state.get_gps_data()}"
+        assert shared_state.get_gps_data()['heading'] == 90.0, "GPS heading mismatch after reconnect"
+        print("✓ Reconnected after gpsd closed the session")
+    finally:
+        stop_event.set()
+        first_seen.set()
+        gps_tracker.GPSD_ADDRESS = original
+
+    thread.join(timeout=2.0)
+    server_thread.join(timeout=2.0)
+    gpsd.close()
+
+    assert not thread.is_alive(), "GPS thread did not stop"
+    assert not errors, f"Fake gpsd failed: {errors}"
+    assert gpsd.watch_commands == [gps_tracker.GPSD_WATCH_COMMAND] * 2, \
+        f"Unexpected WATCH commands: {gpsd.watch_commands}"
+    print("✓ Sent ?WATCH on both connections and stopped cleanly")
+    return True
+
+
+def run_all_tests():
+    """Run all GPS tracker tests."""
+    tests = [
+        test_gpsd_stream_parsing_and_reconnect,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except Exception as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
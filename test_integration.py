@@ -459,6 +459,118 @@ def test_graceful_degradation():
     return frame, "graceful_degradation"
 
 
+def test_cached_text_rendering():
+    """Test that sprite-cached text matches direct putText rendering."""
+    print("\n=== Test: Cached Text Rendering ===")
+    from draw_utils import draw_text
+    from theme import FONT, FONT_SCALE, THICKNESS
+    
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+    
+    # Includes positions that clip against the frame edges
+    for position in [(100, 100), (-5, 5), (1250, 715)]:
+        expected = background.copy()
+        cv2.putText(expected, "CPU: 45.2%", position, FONT, FONT_SCALE, (0, 0, 0), THICKNESS + 2, cv2.LINE_AA)
+        cv2.putText(expected, "CPU: 45.2%", position, FONT, FONT_SCALE, (255, 20, 147), THICKNESS, cv2.LINE_AA)
+        
+        # Draw twice so the second call uses the cached sprite
+        for _ in range(2):
+            frame = background.copy()
+            draw_text(frame, "CPU: 45.2%", position, (255, 20, 147))
+            diff = np.abs(frame.astype(np.int16) - expected.astype(np.int16))
+            assert diff.max() <= 2, f"Text at {position} differs by {diff.max()}"
+        print(f"  ✓ Text at {position} matches direct rendering")
+    
+    print("✓ Cached text rendering verified")
+    
+    return frame, "cached_text_rendering"
+
+
+def test_cached_layers_match_direct_drawing():
+    """Test that widgets blitted from cached layers match drawing them directly."""
+    print("\n=== Test: Cached Layer Rendering ===")
+    import draw_utils
+    
+    # Long SSIDs, km distances and more networks than the list shows, placed at
+    # the edges of the heading bar's range and stacked on the compass
+    test_devices = []
+    for i in range(10):
+        ssid = f"Net{i}-" + "W" * (26 if i % 3 == 0 else 4)
+        test_devices.append({
+            'ssid': ssid,
+            'signal_dbm': -40 - 5 * i,
+            'channel': '6',
+            'device_type': ['router', 'drone', 'unknown'][i % 3],
+            'distance_m': 1500.0 if i % 2 else 12.0 + i,
+            'color': assign_device_color(ssid)
+        })
+    
+    # Compass labels aren't truncated: iwlist-escaped SSIDs, glyphs wider than
+    # 'W' and distances of 1000km+ must all stay inside the cached compass
+    for ssid, distance_m in [(r'\xF0\x9F\x93\xB6' * 4 + ' Cafe Guest', 1250000.0),
+                             ('@' * 32, 0.0)]:
+        test_devices.append({
+            'ssid': ssid,
+            'signal_dbm': -60,
+            'channel': '11',
+            'device_type': 'unknown',
+            'distance_m': distance_m,
+            'color': assign_device_color(ssid)
+        })
+    
+    shared_state = SharedState()
+    shared_state.set_wifi_networks(test_devices)
+    shared_state.set_imu_data(heading=180.0)
+    directions = [121.0, 122.0, 124.0, 239.0, 238.0, 236.0, 45.0, 50.0, 300.0, 180.0, 90.0, 140.0]
+    for device, direction in zip(test_devices, directions):
+        shared_state.set_wifi_direction(device['ssid'], direction, 0.9)
+    snapshot = shared_state.get_snapshot()
+    
+    rng = np.random.default_rng(1)
+    draw_utils._cached_layers.clear()
+    
+    # Layers are captured once their key holds for a few frames, so render
+    # enough identical frames to cover direct, captured and blitted drawing
+    for i in range(draw_utils.CACHED_LAYER_STABLE_FRAMES + 2):
+        background = rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+        frame = render_hud(background.copy(), snapshot)
+        
+        # Reference render with every layer drawn directly
+        saved_layers = dict(draw_utils._cached_layers)
+        draw_utils._cached_layers.clear()
+        expected = render_hud(background.copy(), snapshot)
+        draw_utils._cached_layers.clear()
+        draw_utils._cached_layers.update(saved_layers)
+        
+        diff = np.abs(frame.astype(np.int16) - expected.astype(np.int16))
+        assert diff.max() <= 2, f"Frame {i} differs from direct drawing by {diff.max()}"
+    
+    assert all(entry[2] is not None for entry in draw_utils._cached_layers.values()), \
+        "Stable layers should have been captured"
+    
+    print("✓ Cached layers match direct drawing")
+    
+    return frame, "cached_layers"
+
+
+def test_heading_quantization():
+    """Test that quantizing the heading bar's heading keeps its readout unchanged."""
+    print("\n=== Test: Heading Quantization ===")
+    from hud_renderer import _quantize_heading
+    
+    for heading in [0.0, 0.04, 12.97, 13.0, 90.05, 180.99, 359.5, 359.96, 359.999]:
+        quantized = _quantize_heading(heading)
+        assert 0 <= quantized < 360, f"{heading} quantized out of range: {quantized}"
+        assert int(quantized) == int(heading), \
+            f"Readout for {heading} changed: {int(quantized):03d} != {int(heading):03d}"
+        assert heading - quantized < 0.1 + 1e-9
+    
+    print("✓ Quantized headings keep their whole-degree readout")
+    
+    return create_test_frame(), "heading_quantization"
+
+
 def test_various_headings():
     """Test heading readout bar with various heading values."""
     print("\n=== Test 8: Various Heading Values ===")
@@ -570,6 +682,9 @@ def run_all_tests(save_frames=False):
         test_color_consistency,
         test_mixed_device_types,
         test_graceful_degradation,
+        test_cached_text_rendering,
+        test_cached_layers_match_direct_drawing,
+        test_heading_quantization,
         test_various_headings,
         test_performance
     ]
@@ -96,6 +96,75 @@ def test_shared_state_operations():
     return True
 
 
+def test_audio_ring_lapped_reader():
+    """Test that an audio read retries when the writer laps it mid-copy."""
+    print("\n=== Test: Audio Ring Lapped Reader ===")
+    
+    import numpy as np
+    from shared_state import AUDIO_RING_SLOTS
+    
+    shared_state = SharedState()
+    shared_state.set_audio_buffer(np.zeros(1024, dtype=np.int16))
+    
+    copies = []
+    
+    class LappingSlot(np.ndarray):
+        """Ring slot whose first copy() lets the writer publish a full lap."""
+        def copy(self, *args, **kwargs):
+            copies.append(self)
+            if len(copies) == 1:
+                for value in range(1, AUDIO_RING_SLOTS + 1):
+                    shared_state.set_audio_buffer(np.full(1024, value, dtype=np.int16))
+            return np.asarray(self).copy(*args, **kwargs)
+    
+    shared_state._audio_slots = [slot.view(LappingSlot) for slot in shared_state._audio_slots]
+    
+    data = shared_state.get_audio_buffer()
+    assert len(copies) == 2, f"Expected one retry, got {len(copies) - 1}"
+    assert type(data) is np.ndarray, "Read returned a ring slot instead of a copy"
+    assert np.all(data == AUDIO_RING_SLOTS), f"Read returned stale samples: {data[:4]}"
+    assert shared_state.get_audio_sequence() == AUDIO_RING_SLOTS + 1, "Audio sequence mismatch"
+    print("✓ Reader retried after being lapped and returned the newest buffer")
+    
+    return True
+
+
+def test_audio_ring_reallocation():
+    """Test that the audio ring is reallocated when the buffer shape changes."""
+    print("\n=== Test: Audio Ring Reallocation ===")
+    
+    import numpy as np
+    
+    shared_state = SharedState()
+    assert shared_state.get_audio_buffer() is None, "Empty ring returned data"
+    
+    for _ in range(3):
+        shared_state.set_audio_buffer(np.ones(2048, dtype=np.int16))
+    slots = shared_state._audio_slots
+    assert shared_state.get_audio_sequence() == 3, "Audio sequence mismatch"
+    
+    shared_state.set_audio_buffer(np.arange(1024, dtype=np.int16))
+    assert shared_state._audio_slots is not slots, "Ring not reallocated for a new shape"
+    assert shared_state.get_audio_sequence() == 1, "Audio sequence not reset on reallocation"
+    data = shared_state.get_audio_buffer()
+    assert data.shape == (1024,) and np.array_equal(data, np.arange(1024)), "Reallocated ring returned wrong samples"
+    print("✓ Shape change reallocates the ring and restarts the sequence")
+    
+    slots = shared_state._audio_slots
+    shared_state.set_audio_buffer(np.arange(1024, dtype=np.int16)[::-1])
+    assert shared_state._audio_slots is slots, "Ring reallocated for an unchanged shape"
+    assert shared_state.get_audio_buffer()[0] == 1023, "Same-shape write not published"
+    print("✓ Same-shape writes reuse the ring")
+    
+    shared_state.set_audio_buffer(np.zeros(1024, dtype=np.float32))
+    assert shared_state.get_audio_buffer().dtype == np.float32, "Ring not reallocated for a new dtype"
+    shared_state.set_audio_buffer(None)
+    assert shared_state.get_audio_buffer() is None, "Cleared ring returned data"
+    print("✓ dtype change reallocates and None clears the ring")
+    
+    return True
+
+
 def test_device_classification_logic():
     """Test device classification logic."""
     print("\n=== Test 2: Device Classification Logic ===")
@@ -147,6 +216,44 @@ def test_distance_estimation_logic():
     return True
 
 
+def test_iwlist_parsing_logic():
+    """Test parsing of raw iwlist scan output."""
+    print("\n=== Test: iwlist Output Parsing ===")
+    from wifi_scanner import parse_iwlist_output
+    
+    output = """wlan1     Scan completed :
+          Cell 01 - Address: 00:11:22:33:44:55
+                    Channel:6
+                    Frequency:2.437 GHz (Channel 6)
+                    Quality=70/70  Signal level=-40 dBm  
+                    Encryption key:on
+                    ESSID:"HomeRouter"
+          Cell 02 - Address: 66:77:88:99:AA:BB
+                    Channel:149
+                    Quality=40/70  Signal level=-70 dBm  
+                    Encryption key:off
+                    ESSID:"DJI-Mavic"
+          Cell 03 - Address: 66:77:88:99:AA:CC
+                    Quality=40/70  Signal level=-70 dBm  
+                    Encryption key:off
+"""
+    
+    cells = parse_iwlist_output(output)
+    
+    # Cell 03 has no ESSID and is skipped
+    assert cells == [
+        ("HomeRouter", "-40 dBm", "6", "Secured"),
+        ("DJI-Mavic", "-70 dBm", "149", "Open"),
+    ], f"Unexpected parse result: {cells}"
+    for cell in cells:
+        print(f"✓ Parsed '{cell[0]}' (signal {cell[1]}, channel {cell[2]}, {cell[3]})")
+    
+    assert parse_iwlist_output("") == [], "Empty output should yield no cells"
+    
+    print("✓ iwlist parsing logic validated")
+    return True
+
+
 def test_color_assignment_consistency():
     """Test that color assignment is consistent for same SSID."""
     print("\n=== Test 4: Color Assignment Consistency ===")
@@ -438,6 +545,38 @@ def test_performance_logic():
     return True
 
 
+def test_passthrough_gain():
+    """Test the Q12 passthrough gain: conversion, clamping and clipping."""
+    print("\n=== Test: Audio Passthrough Gain ===")
+    
+    import numpy as np
+    from audio_service import GAIN_SHIFT, passthrough_gain_fixed_point, apply_passthrough_gain
+    
+    unity = 1 << GAIN_SHIFT
+    assert passthrough_gain_fixed_point(1.0) == unity, "Unity gain mismatch"
+    assert passthrough_gain_fixed_point(0.5) == unity // 2, "Half gain mismatch"
+    assert passthrough_gain_fixed_point(100.0) == 8 * unity, "Gain above range not clamped"
+    assert passthrough_gain_fixed_point(-1.0) == 0, "Negative gain not clamped"
+    for gain in (float('nan'), float('inf'), float('-inf')):
+        assert passthrough_gain_fixed_point(gain) == unity, f"Non-finite gain {gain} not reset to 1.0"
+    print("✓ Gains converted, clamped, and non-finite gains fall back to 1.0")
+    
+    indata = np.array([[-32768], [-4097], [-4096], [-1], [0], [1], [4095], [4096], [32767]], dtype=np.int16)
+    outdata = np.empty_like(indata)
+    scratch = np.empty(indata.shape, dtype=np.int32)
+    
+    apply_passthrough_gain(indata, outdata, passthrough_gain_fixed_point(8.0), scratch)
+    expected = np.clip(indata.astype(np.int64) * 8, -32768, 32767)
+    assert np.array_equal(outdata, expected), f"Gain 8 clipping mismatch: {outdata.ravel()}"
+    print("✓ Gain 8 hard-clips full-scale samples to the int16 range")
+    
+    apply_passthrough_gain(indata, outdata, passthrough_gain_fixed_point(1.0), scratch)
+    assert np.array_equal(outdata, indata), "Unity gain altered samples"
+    print("✓ Unity gain passes samples through unchanged")
+    
+    return True
+
+
 def run_all_tests():
     """Run all integration logic tests."""
     print("="*60)
@@ -447,14 +586,18 @@ def run_all_tests():
     
     tests = [
         test_shared_state_operations,
+        test_audio_ring_lapped_reader,
+        test_audio_ring_reallocation,
         test_device_classification_logic,
         test_distance_estimation_logic,
+        test_iwlist_parsing_logic,
         test_color_assignment_consistency,
         test_stacking_logic,
         test_distance_formatting,
         test_triangulation_logic,
         test_data_flow,
         test_performance_logic,
+        test_passthrough_gain,
     ]
     
     passed = 0
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Wi-Fi Calibration Interface Detection Tests
+-------------------------------------------
+Tests the adapter detection used by the calibration workflow against a fake
+/sys/class/net directory and a fake 'ip monitor link' event stream, including
+an adapter that udev renames (wlan1 -> wlx<mac>) right after it appears.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import main
+
+
+class FakeLinkMonitor:
+    """Stands in for the 'ip monitor link' Popen: events are written to a pipe."""
+
+    def __init__(self):
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, 'rb')
+
+    def emit(self, line):
+        os.write(self._write_fd, (line + "\n").encode())
+
+    def terminate(self):
+        """Close the write end, as if 'ip' exited; the reader then sees EOF."""
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def wait(self, timeout=None):
+        return 0
+
+    def close(self):
+        self.terminate()
+        self.stdout.close()
+
+
+def make_fake_sysfs(interfaces):
+    """Create a fake /sys/class/net with the given wireless interfaces."""
+    root = tempfile.mkdtemp()
+    os.mkdir(os.path.join(root, 'lo'))
+    for name in interfaces:
+        os.makedirs(os.path.join(root, name, 'wireless'))
+    return root
+
+
+def plug_in_renamed_adapter(root, monitor, delay=0.05, rename_delay=0.05):
+    """Simulate an adapter that appears as wlan1 and is then renamed by udev."""
+    def run():
+        time.sleep(delay)
+        os.makedirs(os.path.join(root, 'wlan1', 'wireless'))
+        if monitor is not None:
+            monitor.emit("3: wlan1: <BROADCAST,MULTICAST> mtu 1500 state DOWN")
+        time.sleep(rename_delay)
+        os.rename(os.path.join(root, 'wlan1'), os.path.join(root, 'wlx001122334455'))
+        if monitor is not None:
+            monitor.emit("3: wlx001122334455: <BROADCAST,MULTICAST> mtu 1500 state DOWN")
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_interface_listing():
+    """Test that only external wireless interfaces are listed from sysfs."""
+    print("\n=== Test: Interface Listing ===")
+
+    root = make_fake_sysfs(['wlan0', 'wlp1s0', 'wlan1', 'wlx00aa'])
+    os.mkdir(os.path.join(root, 'eth0'))
+    original = main.SYS_CLASS_NET
+    main.SYS_CLASS_NET = root
+    try:
+        interfaces = main.get_wifi_interfaces()
+    finally:
+        main.SYS_CLASS_NET = original
+        shutil.rmtree(root)
+
+    assert interfaces == ['wlan1', 'wlx00aa'], f"Unexpected interfaces: {interfaces}"
+    print(f"✓ Listed {interfaces}")
+    return True
+
+
+def test_renamed_adapter_with_monitor():
+    """Test that a udev rename is reported under the final name (link monitor)."""
+    print("\n=== Test: Renamed Adapter (link monitor) ===")
+
+    root = make_fake_sysfs(['wlan0'])
+    monitor = FakeLinkMonitor()
+    original = main.SYS_CLASS_NET
+    main.SYS_CLASS_NET = root
+    try:
+        thread = plug_in_renamed_adapter(root, monitor)
+        interface, current = main.wait_for_new_interface([], monitor, timeout=2.0)
+        thread.join()
+    finally:
+        main.SYS_CLASS_NET = original
+        monitor.close()
+        shutil.rmtree(root)
+
+    assert interface == 'wlx001122334455', f"Expected renamed interface, got {interface}"
+    assert current == ['wlx001122334455'], f"Unexpected interface list: {current}"
+    print(f"✓ Detected {interface}")
+    return True
+
+
+def test_renamed_adapter_without_monitor():
+    """Test that a udev rename is reported under the final name (polling)."""
+    print("\n=== Test: Renamed Adapter (polling) ===")
+
+    root = make_fake_sysfs(['wlan0'])
+    original = main.SYS_CLASS_NET
+    main.SYS_CLASS_NET = root
+    try:
+        thread = plug_in_renamed_adapter(root, None, rename_delay=0.15)
+        interface, _ = main.wait_for_new_interface([], None, timeout=2.0, poll=0.02)
+        thread.join()
+    finally:
+        main.SYS_CLASS_NET = original
+        shutil.rmtree(root)
+
+    assert interface == 'wlx001122334455', f"Expected renamed interface, got {interface}"
+    print(f"✓ Detected {interface}")
+    return True
+
+
+def test_exited_monitor_falls_back_to_polling():
+    """Test that an 'ip monitor' that already exited is closed and polling takes over."""
+    print("\n=== Test: Exited Link Monitor ===")
+
+    root = make_fake_sysfs(['wlan0'])
+    monitor = FakeLinkMonitor()
+    monitor.terminate()
+    original = main.SYS_CLASS_NET
+    main.SYS_CLASS_NET = root
+    try:
+        thread = plug_in_renamed_adapter(root, None, delay=0.1, rename_delay=0.15)
+        interface, current = main.wait_for_new_interface([], monitor, timeout=2.0, poll=0.02)
+        thread.join()
+    finally:
+        main.SYS_CLASS_NET = original
+        monitor.close()
+        shutil.rmtree(root)
+
+    assert interface == 'wlx001122334455', f"Expected renamed interface, got {interface}"
+    assert current == ['wlx001122334455'], f"Unexpected interface list: {current}"
+    assert monitor.stdout.closed, "Exited monitor was not closed"
+    print(f"✓ Detected {interface} by polling")
+    return True
+
+
+def test_no_new_adapter_times_out():
+    """Test that detection gives up after the timeout when nothing is connected."""
+    print("\n=== Test: No New Adapter ===")
+
+    root = make_fake_sysfs(['wlan0', 'wlan1'])
+    monitor = FakeLinkMonitor()
+    original = main.SYS_CLASS_NET
+    main.SYS_CLASS_NET = root
+    try:
+        start = time.monotonic()
+        interface, current = main.wait_for_new_interface(['wlan1'], monitor, timeout=0.2)
+        elapsed = time.monotonic() - start
+    finally:
+        main.SYS_CLASS_NET = original
+        monitor.close()
+        shutil.rmtree(root)
+
+    assert interface is None, f"Unexpected interface: {interface}"
+    assert current == ['wlan1']
+    assert elapsed < 1.0, f"Timeout took {elapsed:.2f}s"
+    print(f"✓ Gave up after {elapsed:.2f}s")
+    return True
+
+
+def run_all_tests():
+    """Run all calibration detection tests."""
+    tests = [
+        test_interface_listing,
+        test_renamed_adapter_with_monitor,
+        test_renamed_adapter_without_monitor,
+        test_exited_monitor_falls_back_to_polling,
+        test_no_new_adapter_times_out,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+        except Exception as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -2,7 +2,6 @@
 # Scans for nearby Wi-Fi networks and parses output
 
 import subprocess
-import time
 import threading
 import logging
 import re
@@ -30,6 +29,17 @@ DRONE_PATTERNS = [
 # Common router channels for 2.4GHz
 COMMON_24GHZ_CHANNELS = ['1', '6', '11']
 
+# Tokens of interest in 'iwlist scan' output: each cell header, plus the rest of
+# the line after each field label (ESSID is first so a label inside an SSID is
+# never mistaken for a field)
+_IWLIST_TOKEN_RE = re.compile(
+    r'(?P<cell>Cell )'
+    r'|ESSID:(?P<ssid>.*)'
+    r'|Signal level=(?P<signal>.*)'
+    r'|Channel:(?P<channel>.*)'
+    r'|Encryption key:(?P<key>.*)'
+)
+
 
 def classify_device(ssid, frequency, channel):
     """
@@ -154,6 +164,48 @@ def parse_signal_dbm(signal_str):
         return None
 
 
+def parse_iwlist_output(output):
+    """
+    Parse raw 'iwlist <interface> scan' output into per-cell fields.
+    
+    Walks the output with a single compiled regex instead of splitting it into
+    cells and lines. Cells without an ESSID are skipped.
+    
+    Args:
+        output: stdout of 'iwlist <interface> scan'
+        
+    Returns:
+        List of (ssid, signal, channel, security) tuples, with "Unknown" for
+        missing values and security "Secured" or "Open"
+    """
+    cells = []
+    ssid = None
+    signal = channel = "Unknown"
+    security = "Open"
+    
+    for match in _IWLIST_TOKEN_RE.finditer(output):
+        kind = match.lastgroup
+        if kind == 'cell':
+            if ssid is not None:
+                cells.append((ssid, signal, channel, security))
+            ssid = None
+            signal = channel = "Unknown"
+            security = "Open"
+        elif kind == 'ssid':
+            ssid = match.group('ssid').strip().strip('"')
+        elif kind == 'signal':
+            signal = match.group('signal').strip()
+        elif kind == 'channel':
+            channel = match.group('channel').strip()
+        elif match.group('key').strip() == "on":
+            security = "Secured"
+    
+    if ssid is not None:
+        cells.append((ssid, signal, channel, security))
+    
+    return cells
+
+
 def scan_wifi(interface="wlan0"):
     """
     Scans for nearby Wi-Fi networks using 'iwlist' and returns
@@ -176,28 +228,7 @@ def scan_wifi(interface="wlan0"):
         )
         output = result.stdout
 
-        for block in output.split("Cell "):
-            if "ESSID" not in block:
-                continue
-
-            ssid = "Unknown"
-            signal = "Unknown"
-            channel = "Unknown"
-            security = "Open"
-
-            for line in block.split("\n"):
-                line = line.strip()
-                if "ESSID:" in line:
-                    ssid = line.split("ESSID:")[1].strip().strip('"')
-                elif "Signal level=" in line:
-                    signal = line.split("Signal level=")[1].strip()
-                elif "Channel:" in line:
-                    channel = line.split("Channel:")[1].strip()
-                elif "Encryption key:" in line:
-                    key = line.split("Encryption key:")[1].strip()
-                    if key == "on":
-                        security = "Secured"
-
+        for ssid, signal, channel, security in parse_iwlist_output(output):
             # Extract frequency from channel
             frequency = extract_frequency_from_channel(channel)
             
@@ -268,11 +299,8 @@ def start_wifi_scanner_service(shared_state, stop_event, interface="wlan0"):
                 else:
                     logger.warning(f"No Wi-Fi networks found on {interface}")
                 
-                # Sleep for scan interval, checking stop_event periodically
-                for _ in range(SCAN_INTERVAL):
-                    if stop_event.is_set():
-                        break
-                    time.sleep(1)
+                # Sleep for scan interval, waking immediately on stop_event
+                stop_event.wait(SCAN_INTERVAL)
         
         except Exception as e:
             logger.error(f"Wi-Fi scanner service error: {e}", exc_info=True)